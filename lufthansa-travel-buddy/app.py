@@ -1,10 +1,31 @@
 import streamlit as st
 import asyncio
-from travel_buddy.agent import root_agent
+import queue
+import threading
+import time
+import uuid
+from travel_buddy.agent import app
+from travel_buddy.config import REDIS_URL, SESSION_TTL_SECONDS
+from travel_buddy.shared_libraries import RedisSessionService, latency_summary, record_latency
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai.types import Content, Part
 
+APP_NAME = app.name
+USER_ID = "streamlit-user"
+
+# Chat history entries are (role, content) tuples; role indexes ROLE_NAMES
+USER, ASSISTANT = 0, 1
+ROLE_NAMES = ("user", "assistant")
+
+# Sidebar quick action; its Content is built once and reused on every click
+LH400_PROMPT = "Check the status of flight LH400 today"
+LH400_MSG = Content(role="user", parts=[Part(text=LH400_PROMPT)])
+
+# Minimum seconds between chunks pushed to st.write_stream (~20 UI updates/s)
+STREAM_FLUSH_INTERVAL = 0.05
+
 st.set_page_config(
     page_title="Lufthansa Travel Buddy",
     page_icon="✈️",
@@ -14,64 +35,251 @@ st.set_page_config(
 st.title("✈️ Lufthansa Business Travel Buddy")
 st.caption("Proactive disruption manager for business travelers")
 
-if "runner" not in st.session_state:
-    st.session_state.session_id = "streamlit-session"
-    st.session_state.messages = []
-    st.session_state.session_service = InMemorySessionService()
-    st.session_state.runner = Runner(
-        agent=root_agent,
-        app_name="lufthansa_travel_buddy",
-        session_service=st.session_state.session_service,
+
+@st.cache_resource
+def get_loop():
+    """Process-wide event loop shared by all sessions, running in a daemon thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def get_runner():
+    """Process-wide Runner; the agent graph is built once, sessions differ per user."""
+    if REDIS_URL:
+        session_service = RedisSessionService(url=REDIS_URL, ttl=SESSION_TTL_SECONDS)
+    else:
+        session_service = InMemorySessionService()
+    return Runner(app=app, session_service=session_service)
+
+
+def run_sync(coro):
+    """Run a coroutine on the shared background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, st.session_state.loop).result()
+
+
+def load_messages(session):
+    """Rebuild chat history from the text parts of a stored session's events."""
+    messages = []
+    for event in session.events:
+        if not (event.content and event.content.parts):
+            continue
+        text = "".join(part.text for part in event.content.parts if part.text)
+        if not text:
+            continue
+        role = USER if event.author == "user" else ASSISTANT
+        if messages and messages[-1][0] == role:
+            messages[-1] = (role, messages[-1][1] + text)
+        else:
+            messages.append((role, text))
+    return messages
+
+
+def new_session():
+    """Create an empty ADK session and point the URL at it."""
+    session = run_sync(
+        st.session_state.runner.session_service.create_session(
+            app_name=APP_NAME,
+            user_id=USER_ID,
+            session_id=str(uuid.uuid4()),
+        )
     )
-    asyncio.run(
-        st.session_state.session_service.create_session(
-            app_name="lufthansa_travel_buddy",
-            user_id="streamlit-user",
-            session_id=st.session_state.session_id,
+    st.query_params["session"] = session.id
+    return session
+
+
+# The loop is shared like the runner: objects the runner holds (session
+# service, HTTP clients) must only ever be driven from one event loop.
+st.session_state.loop = get_loop()
+st.session_state.runner = get_runner()
+
+if "session_id" not in st.session_state:
+    # The session id lives in the URL so a reload (or a restart, with a
+    # persistent session store) resumes the same conversation
+    session_id = st.query_params.get("session")
+    session_service = st.session_state.runner.session_service
+    session = None
+    if session_id:
+        session = run_sync(
+            session_service.get_session(
+                app_name=APP_NAME,
+                user_id=USER_ID,
+                session_id=session_id,
+            )
         )
+    if session is None:
+        session = new_session()
+    st.session_state.session_id = session.id
+    st.session_state.messages = load_messages(session)
+    # Futures of agent turns still running on the background loop: quick
+    # actions, and a chat turn whose streaming was cut off by a rerun
+    st.session_state.pending = []
+    # Future of the chat turn in progress, if any
+    st.session_state.chat_turn = None
+
+
+async def run_turn(runner, session_id, user_message, chunks=None):
+    """
+    Run one agent turn to completion and return its response text.
+    
+    With `chunks` (a queue.Queue), the turn streams over SSE and each
+    text piece is also put on the queue as it arrives, then None once
+    the turn ends. The turn runs on the background loop, so it finishes
+    even if the script run rendering it is interrupted by a rerun.
+    """
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE) if chunks else RunConfig()
+    response_text = ""
+    streamed = False
+    started = time.monotonic()
+    try:
+        async for event in runner.run_async(
+            user_id=USER_ID,
+            session_id=session_id,
+            new_message=user_message,
+            run_config=run_config,
+        ):
+            if not (event.content and event.content.parts):
+                continue
+            # With SSE, text arrives in partial events followed by one final
+            # event repeating the aggregated text -- skip that repeat.
+            if not event.partial and streamed:
+                streamed = False
+                continue
+            streamed = bool(event.partial)
+            text = "".join(part.text for part in event.content.parts if part.text)
+            if not text:
+                continue
+            if not response_text:
+                record_latency("agent_first_chunk", time.monotonic() - started)
+            response_text += text
+            if chunks is not None:
+                chunks.put(text)
+    finally:
+        if chunks is not None:
+            chunks.put(None)
+        record_latency("agent_turn", time.monotonic() - started)
+    return response_text
+
+
+def start_turn(user_message, chunks=None):
+    """Schedule an agent turn on the background loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(
+        run_turn(st.session_state.runner, st.session_state.session_id, user_message, chunks),
+        st.session_state.loop,
     )
 
-for msg in st.session_state.messages:
-    with st.chat_message(msg["role"]):
-        st.markdown(msg["content"])
 
-if prompt := st.chat_input("Ask about your flight, delays, or travel plans..."):
-    st.session_state.messages.append({"role": "user", "content": prompt})
-    with st.chat_message("user"):
-        st.markdown(prompt)
+def stream_response(chunks):
+    """Yield a streaming turn's text from `chunks` until the turn ends."""
+    buf = ""
+    last = time.monotonic()
+    while (text := chunks.get()) is not None:
+        buf += text
+        # Coalesce token events so the UI re-renders at a bounded rate
+        now = time.monotonic()
+        if now - last >= STREAM_FLUSH_INTERVAL:
+            yield buf
+            buf = ""
+            last = now
+    if buf:
+        yield buf
+
+
+def start_quick_action(prompt, user_message):
+    """Button callback: queue the message on the background loop without waiting for it."""
+    st.session_state.messages.append((USER, prompt))
+    st.session_state.pending.append(start_turn(user_message))
+
+
+def clear_chat():
+    """
+    Button callback: start over in a fresh session.
     
-    with st.chat_message("assistant"):
-        with st.spinner("Checking flights..."):
-            async def get_response():
-                user_message = Content(
-                    role="user",
-                    parts=[Part(text=prompt)]
-                )
-                response_text = ""
-                async for event in st.session_state.runner.run_async(
-                    user_id="streamlit-user",
-                    session_id=st.session_state.session_id,
-                    new_message=user_message,
-                ):
-                    if hasattr(event, 'content') and event.content:
-                        if hasattr(event.content, 'parts'):
-                            for part in event.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    response_text += part.text
-                return response_text
-            
-            response = asyncio.run(get_response())
-            if response:
-                st.markdown(response)
-                st.session_state.messages.append({"role": "assistant", "content": response})
+    The agent forgets the old turns and state too, and a reload doesn't
+    bring them back. Turns still running finish on the old session and
+    are dropped.
+    """
+    st.session_state.session_id = new_session().id
+    st.session_state.messages = []
+    st.session_state.pending = []
+    st.session_state.chat_turn = None
+
+
+@st.fragment(run_every=1.0)
+def poll_pending():
+    """Merge finished background turns into the chat; only rendered while some are pending."""
+    done = [f for f in st.session_state.pending if f.done()]
+    if not done:
+        st.caption(f"⏳ {len(st.session_state.pending)} request(s) running...")
+        return
+    for future in done:
+        st.session_state.pending.remove(future)
+        if future is st.session_state.chat_turn:
+            st.session_state.chat_turn = None
+        if future.exception():
+            st.session_state.messages.append((ASSISTANT, f"⚠️ Request failed: {future.exception()}"))
+        elif future.result():
+            st.session_state.messages.append((ASSISTANT, future.result()))
+    st.rerun()
+
+
+@st.fragment
+def chat_panel():
+    """Chat history and input; reruns on its own so the rest of the page stays static."""
+    for role, content in st.session_state.messages:
+        with st.chat_message(ROLE_NAMES[role]):
+            st.markdown(content)
+    
+    # One chat turn at a time; quick actions may run alongside it
+    if prompt := st.chat_input(
+        "Ask about your flight, delays, or travel plans...",
+        disabled=st.session_state.chat_turn is not None,
+    ):
+        st.session_state.messages.append((USER, prompt))
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        
+        # Registered as pending first: if a quick-action click reruns the
+        # app mid-stream, the turn keeps running and poll_pending merges it
+        chunks = queue.Queue()
+        future = start_turn(Content(role="user", parts=[Part(text=prompt)]), chunks)
+        st.session_state.chat_turn = future
+        st.session_state.pending.append(future)
+        
+        with st.chat_message("assistant"):
+            st.write_stream(stream_response(chunks))
+            st.session_state.pending.remove(future)
+            st.session_state.chat_turn = None
+            if future.exception():
+                st.error(f"Request failed: {future.exception()}")
+            elif future.result():
+                st.session_state.messages.append((ASSISTANT, future.result()))
             else:
                 st.warning("No response received")
 
+
+# Sidebar actions are handled before the chat panel renders, so the
+# full-page rerun their click triggers already shows the new state.
+# Quick actions run in the background alongside a streaming chat turn
+# and are merged by poll_pending once done; the button is disabled only
+# while its previous run is still pending.
 with st.sidebar:
     st.header("Quick Actions")
-    if st.button("Check LH400 Status"):
-        st.session_state.messages.append({"role": "user", "content": "Check the status of flight LH400 today"})
-        st.rerun()
-    if st.button("Clear Chat"):
-        st.session_state.messages = []
-        st.rerun()
+    st.button(
+        "Check LH400 Status",
+        on_click=start_quick_action,
+        args=(LH400_PROMPT, LH400_MSG),
+        disabled=any(f is not st.session_state.chat_turn for f in st.session_state.pending),
+    )
+    st.button("Clear Chat", on_click=clear_chat)
+    if st.session_state.pending:
+        poll_pending()
+    with st.expander("Latency"):
+        rows = latency_summary()
+        if rows:
+            st.dataframe(rows, hide_index=True)
+        else:
+            st.caption("No calls recorded yet")
+
+chat_panel()
@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import functools
 import os
 import sys
 from pathlib import Path
@@ -28,6 +29,17 @@ def get_config():
     return project_id, location
 
 
+@functools.lru_cache(maxsize=1)
+def load_agent():
+    """Load the travel_buddy agent once per interpreter."""
+    # Imported here rather than at module top so --list/--delete don't
+    # pay for loading ADK and the agent's tool graph
+    from google.adk.cli.utils.agent_loader import AgentLoader
+    
+    agent_loader = AgentLoader(agents_dir=Path(__file__).parent.parent)
+    return agent_loader.load_agent("travel_buddy")
+
+
 def create_agent():
     project_id, location = get_config()
     
@@ -37,11 +49,17 @@ def create_agent():
     
     aiplatform.init(project=project_id, location=location)
     
-    from google.adk.cli.utils.agent_loader import AgentLoader
+    # Deferred like AgentLoader: the deployment module is heavy and is not
+    # shipped by every google-adk release, so a top-level import would
+    # break --list/--delete as well
+    from google.adk.apps import App
     from google.adk.deployment import deploy_to_agent_engine
     
-    agent_loader = AgentLoader(agents_dir=Path(__file__).parent.parent)
-    agent = agent_loader.load_agent("travel_buddy")
+    # AgentLoader returns the package's App when it exports one;
+    # deploy_to_agent_engine takes the agent itself, so unwrap it. The
+    # App's context-cache settings are not sent with the deployment.
+    loaded = load_agent()
+    agent = loaded.root_agent if isinstance(loaded, App) else loaded
     
     print(f"   Agent: {agent.name}")
     
@@ -0,0 +1,10 @@
+"""Shared pytest setup."""
+
+import os
+
+# travel_buddy.config requires these at import time
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+os.environ.setdefault("LUFTHANSA_CLIENT_ID", "test-client")
+os.environ.setdefault("LUFTHANSA_CLIENT_SECRET", "test-secret")
+os.environ["LH_TOKEN_CACHE_PATH"] = ""
+os.environ.pop("REDIS_URL", None)
@@ -0,0 +1,104 @@
+"""Tests for the flight lookup batcher."""
+
+import asyncio
+
+import pytest
+
+from travel_buddy.sub_agents.flight.batcher import AsyncBatcher
+
+
+class Dispatcher:
+    """Dispatch stub recording every batch it receives."""
+
+    def __init__(self, fail=None):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if self.fail is not None:
+            raise self.fail
+        return [ValueError(key) if key == "bad" else f"result:{key}" for key in keys]
+
+
+@pytest.mark.asyncio
+async def test_identical_keys_share_one_dispatch():
+    dispatch = Dispatcher()
+    batcher = AsyncBatcher(dispatch, window_ms=5)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("a"), batcher.submit("b")
+    )
+
+    assert results == ["result:a", "result:a", "result:b"]
+    assert dispatch.batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_dispatches_before_the_window_closes():
+    dispatch = Dispatcher()
+    batcher = AsyncBatcher(dispatch, window_ms=10_000, max_batch=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1
+    )
+
+    assert results == ["result:a", "result:b"]
+    assert dispatch.batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_error_reaches_every_caller():
+    dispatch = Dispatcher(fail=RuntimeError("upstream down"))
+    batcher = AsyncBatcher(dispatch, window_ms=5)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("a"), batcher.submit("b"),
+        return_exceptions=True,
+    )
+
+    assert [type(r) for r in results] == [RuntimeError] * 3
+    assert dispatch.batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_exception_result_only_fails_its_key():
+    batcher = AsyncBatcher(Dispatcher(), window_ms=5)
+
+    good, bad = await asyncio.gather(
+        batcher.submit("good"), batcher.submit("bad"), return_exceptions=True
+    )
+
+    assert good == "result:good"
+    assert isinstance(bad, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_short_dispatch_result_fails_the_unmatched_keys():
+    async def dispatch(keys):
+        return [f"result:{key}" for key in keys[:1]]
+
+    batcher = AsyncBatcher(dispatch, window_ms=5)
+
+    first, second = await asyncio.wait_for(
+        asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+        timeout=1,
+    )
+
+    assert first == "result:a"
+    assert isinstance(second, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_lookup():
+    dispatch = Dispatcher()
+    batcher = AsyncBatcher(dispatch, window_ms=5)
+
+    cancelled = asyncio.create_task(batcher.submit("a"))
+    waiting = asyncio.create_task(batcher.submit("a"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await waiting == "result:a"
+    assert dispatch.batches == [["a"]]
@@ -0,0 +1,67 @@
+"""Tests for the calendar domain tools."""
+
+import pytest
+
+from travel_buddy.sub_agents.calendar import tools
+from travel_buddy.sub_agents.calendar.tools import MOCK_CALENDAR
+
+
+def test_calendar_events_keep_source_order():
+    result = tools.get_calendar_events("2026-02-28")
+
+    assert result["events"] == MOCK_CALENDAR["2026-02-28"]
+    assert result["event_count"] == 3
+
+
+
+def linear_buckets(arrival_time, date):
+    """The original per-event scan: (will_miss, at_risk, safe) event ids."""
+    hour, minute = map(int, arrival_time.split(":"))
+    available = (hour + 1) * 60 + minute
+    buckets = ([], [], [])
+    for event in MOCK_CALENDAR.get(date, []):
+        h, m = map(int, event["start"].split(":"))
+        start = h * 60 + m
+        if available > start:
+            buckets[0].append(event["id"])
+        elif available > start - 30:
+            buckets[1].append(event["id"])
+        else:
+            buckets[2].append(event["id"])
+    return tuple(sorted(ids) for ids in buckets)
+
+
+def bisect_buckets(arrival_time, date):
+    result = tools.find_meeting_conflicts(arrival_time, date)
+    return tuple(
+        sorted(event["id"] for event in result[key])
+        for key in ("conflicts", "at_risk", "safe")
+    )
+
+
+@pytest.mark.parametrize("date", sorted(MOCK_CALENDAR) + ["2026-01-01"])
+def test_bisect_buckets_match_linear_scan(date):
+    arrivals = [f"{h:02d}:{m:02d}" for h in range(4, 23) for m in range(0, 60, 5)]
+    for arrival in arrivals:
+        assert bisect_buckets(arrival, date) == linear_buckets(arrival, date), arrival
+
+
+@pytest.mark.parametrize(
+    "arrival, expected",
+    [
+        # Available at 16:00 sharp: not missed, but no buffer
+        ("15:00", (["evt_003"], ["evt_001"], ["evt_002"])),
+        # Exactly 30 minutes of buffer is safe
+        ("14:30", (["evt_003"], [], ["evt_001", "evt_002"])),
+        ("14:31", (["evt_003"], ["evt_001"], ["evt_002"])),
+    ],
+)
+def test_bucket_boundaries(arrival, expected):
+    assert bisect_buckets(arrival, "2026-02-28") == expected
+
+
+def test_calendar_events_are_fresh_dicts():
+    first = tools.get_calendar_events("2026-02-28")["events"]
+    first[0]["title"] = "changed"
+
+    assert tools.get_calendar_events("2026-02-28")["events"][0]["title"] != "changed"
@@ -0,0 +1,116 @@
+"""Tests for the communications domain tools."""
+
+import asyncio
+import smtplib
+from types import SimpleNamespace
+
+import pytest
+
+from travel_buddy.sub_agents.comms import tools
+
+
+@pytest.fixture
+def tool_context():
+    return SimpleNamespace(state={})
+
+
+def test_drafts_are_stored_as_rows_in_field_order(tool_context):
+    delay = tools.draft_delay_notification(
+        "ceo@company.com", "Jane", "90 minute delay", "18:00 EST",
+        tool_context=tool_context,
+    )
+    reschedule = tools.draft_reschedule_request(
+        "client@acme.com", "John", "16:00 EST", ["17:00 EST", "18:00 EST"],
+        "flight delay", tool_context=tool_context,
+    )
+
+    rows = tool_context.state["email_drafts"]
+    assert len(rows) == 2
+    assert all(len(row) == len(tools._DRAFT_FIELDS) for row in rows)
+
+    first, second = (dict(zip(tools._DRAFT_FIELDS, row)) for row in rows)
+    assert first == {**delay, "proposed_times": None, "original_time": None}
+    assert second == {**reschedule, "proposed_times": ("17:00 EST", "18:00 EST")}
+
+
+def test_draft_dicts_keep_the_tool_output_shape():
+    delay = tools.draft_delay_notification("a@b.c", "Jane", "late", "18:00")
+    reschedule = tools.draft_reschedule_request("a@b.c", "John", "16:00", ["17:00"], "delay")
+
+    assert list(delay) == ["type", "to", "subject", "body", "status"]
+    assert list(reschedule) == [
+        "type", "to", "subject", "body", "proposed_times", "original_time", "status",
+    ]
+    assert reschedule["proposed_times"] == ["17:00"]
+    assert delay["status"] == reschedule["status"] == "draft"
+
+
+def test_drafts_append_to_existing_state(tool_context):
+    # Rows read back from a persistent session arrive as lists
+    tool_context.state["email_drafts"] = [["email", "x@y.z", "s", "b", "sent", None, None]]
+
+    tools.draft_delay_notification("a@b.c", "Jane", "late", "18:00", tool_context=tool_context)
+
+    assert [row[1] for row in tool_context.state["email_drafts"]] == ["x@y.z", "a@b.c"]
+
+
+# ----------------------------------------
+# SMTP connection reuse
+# ----------------------------------------
+
+class FakeSMTP:
+    """Records sends; `drop` makes the next send fail as a dropped connection."""
+
+    def __init__(self):
+        self.sent = []
+        self.drop = False
+        self.closed = False
+
+    def send_message(self, msg):
+        if self.drop:
+            raise smtplib.SMTPServerDisconnected("gone")
+        self.sent.append(msg["To"])
+
+    def noop(self):
+        raise AssertionError("sends should not be preceded by NOOP")
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    connections = []
+
+    def connect():
+        connections.append(FakeSMTP())
+        return connections[-1]
+
+    monkeypatch.setattr(tools, "SMTP_HOST", "smtp.test")
+    monkeypatch.setattr(tools, "SMTP_SENDER", "buddy@test")
+    monkeypatch.setattr(tools, "_smtp_connect", connect)
+    monkeypatch.setattr(tools, "_smtp_server", None)
+    yield connections
+
+
+@pytest.mark.asyncio
+async def test_sends_share_one_connection(smtp):
+    results = await asyncio.gather(
+        *(tools.send_email(f"user{i}@test", "Hi", "Body") for i in range(5))
+    )
+
+    assert all(r["status"] == "sent" for r in results)
+    assert len(smtp) == 1
+    assert sorted(smtp[0].sent) == [f"user{i}@test" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_replaced_on_send(smtp):
+    await tools.send_email("a@test", "Hi", "Body")
+    smtp[0].drop = True
+
+    result = await tools.send_email("b@test", "Hi", "Body")
+
+    assert result["status"] == "sent"
+    assert smtp[0].closed
+    assert [c.sent for c in smtp] == [["a@test"], ["b@test"]]
@@ -0,0 +1,271 @@
+"""Tests for the flight domain tools."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from travel_buddy.sub_agents.flight import tools
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("LH456", "LH456"),
+        ("lh 456", "LH456"),
+        ("456", "LH456"),
+        ("0456", "LH456"),
+        (" LH0456 ", "LH456"),
+        ("4U 123", "4U123"),
+        ("x3 12", "X312"),
+        ("LH12345", "LH12345"),
+        ("lh inv", "LHINV"),
+    ],
+)
+def test_normalize_flight_number(raw, expected):
+    assert tools._normalize_flight(raw, "2026-02-28") == (expected, "2026-02-28")
+
+
+def test_normalize_flight_defaults_date_to_today(monkeypatch):
+    monkeypatch.setattr(tools, "_today", lambda: "2026-02-28")
+
+    assert tools._normalize_flight("LH400", None) == ("LH400", "2026-02-28")
+    assert tools._normalize_flight("LH400", "2026-03-01") == ("LH400", "2026-03-01")
+
+
+@pytest.mark.asyncio
+async def test_status_tools_share_normalization(monkeypatch):
+    submitted = []
+
+    async def fake_fetch(flight_number, date):
+        submitted.append((flight_number, date))
+        return {"flight": flight_number}
+
+    monkeypatch.setattr(tools, "_fetch_status", fake_fetch)
+    monkeypatch.setattr(tools, "_today", lambda: "2026-02-28")
+
+    await tools.check_flight_status(flight_number="lh 0400")
+    await tools.get_flight_details(flight_number="400")
+
+    assert submitted == [("LH400", "2026-02-28")] * 2
+
+
+@pytest.mark.asyncio
+async def test_cached_boards_are_copied_per_caller(monkeypatch):
+    board = {"airport": "FRA", "flights": [{"flight": "LH400"}]}
+
+    class FakeBoardClient:
+        async def get_departures(self, airport, from_time, limit):
+            return board
+
+    monkeypatch.setattr(tools, "get_lufthansa_client", FakeBoardClient)
+    tools._board_cache.clear()
+
+    first = await tools.get_airport_departures("FRA", from_time="2026-02-28T08:00")
+    first["flights"][0]["flight"] = "mutated"
+    second = await tools.get_airport_departures("FRA", from_time="2026-02-28T08:00")
+    tools._board_cache.clear()
+
+    assert second == {"airport": "FRA", "flights": [{"flight": "LH400"}]}
+
+
+# ----------------------------------------
+# find_alternative_flights
+# ----------------------------------------
+
+class FakeRouteClient:
+    """Stands in for the Lufthansa client, serving one route result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def get_flight_status_by_route(self, origin, destination, date, airline_codes=None):
+        self.calls.append((origin, destination, date, airline_codes))
+        return self.result
+
+
+@pytest.fixture
+def route(monkeypatch):
+    """Install a fake client serving `flights` for the next lookup."""
+    tools._route_cache.clear()
+    tools._failure_cache.clear()
+
+    def install(flights, filtered=True):
+        result = {"flights": flights, "count": len(flights)}
+        if filtered:
+            result["filtered"] = True
+        client = FakeRouteClient(result)
+        monkeypatch.setattr(tools, "get_lufthansa_client", lambda: client)
+        return client
+
+    yield install
+    tools._route_cache.clear()
+    tools._failure_cache.clear()
+
+
+def flight(code, departure_time, status="OT"):
+    return {"flight": code, "departure_time": departure_time, "status": status}
+
+
+async def alternatives(**kwargs):
+    return await tools.find_alternative_flights("HAM", "JFK", "2026-02-28", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_alternatives_are_the_five_earliest_departures(route):
+    times = ["2026-02-28T18:00", "2026-02-28T07:00", "2026-02-28T12:00", "2026-02-28T09:30",
+             "2026-02-28T21:15", "2026-02-28T06:45", "2026-02-28T15:00"]
+    route([flight(f"LH{i}", t) for i, t in enumerate(times)])
+
+    result = await alternatives()
+
+    assert [f["departure_time"][-5:] for f in result["flights"]] == ["06:45", "07:00", "09:30", "12:00", "15:00"]
+    assert result["count"] == 7
+
+
+@pytest.mark.asyncio
+async def test_alternatives_with_equal_departures_keep_api_order(route):
+    route([
+        flight("LH2", "2026-02-28T10:00"),
+        flight("LH1", "2026-02-28T10:00"),
+        flight("LH3", "2026-02-28T09:00"),
+        flight("LH0", "2026-02-28T10:00"),
+    ])
+
+    result = await alternatives()
+
+    assert [f["flight"] for f in result["flights"]] == ["LH3", "LH2", "LH1", "LH0"]
+
+
+@pytest.mark.asyncio
+async def test_recommendation_skips_cancelled_flights(route):
+    route([
+        flight("LH2", "2026-02-28T11:00"),
+        flight("LH1", "2026-02-28T08:00", status="CD"),
+        flight("LH3", "2026-02-28T09:00"),
+    ])
+
+    result = await alternatives()
+
+    assert result["recommendation"] == "LH3 - departs 2026-02-28T09:00"
+    # Cancelled flights are still listed
+    assert [f["flight"] for f in result["flights"]] == ["LH1", "LH3", "LH2"]
+
+
+@pytest.mark.asyncio
+async def test_no_recommendation_when_all_are_cancelled(route):
+    route([flight("LH1", "2026-02-28T08:00", status="CD")])
+
+    result = await alternatives()
+
+    assert result["recommendation"] is None
+    assert result["count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fields, rendered",
+    [
+        ({"departure_time": ""}, "LH1 - departs "),
+        ({}, "LH1 - departs N/A"),
+    ],
+)
+async def test_recommendation_renders_departure_like_before(route, fields, rendered):
+    route([{"flight": "LH1", "status": "OT", **fields}])
+
+    result = await alternatives()
+
+    assert result["recommendation"] == rendered
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_results_keep_only_lufthansa_group(route):
+    route(
+        [
+            flight("UA100", "2026-02-28T06:00"),
+            flight("LX8", "2026-02-28T07:00"),
+            flight("BA1", "2026-02-28T08:00"),
+            flight("EW5", "2026-02-28T09:00"),
+        ],
+        filtered=False,
+    )
+
+    result = await alternatives()
+
+    assert [f["flight"] for f in result["flights"]] == ["LX8", "EW5"]
+    assert result["count"] == 2
+    assert result["recommendation"] == "LX8 - departs 2026-02-28T07:00"
+
+
+@pytest.mark.asyncio
+async def test_route_lookup_asks_the_client_to_filter(route):
+    client = route([flight("LH1", "2026-02-28T07:00")])
+
+    await alternatives()
+
+    assert client.calls == [("HAM", "JFK", "2026-02-28", tools._LH_PREFIXES)]
+
+
+@pytest.mark.asyncio
+async def test_alternatives_do_not_share_the_cached_route(route):
+    client = route([flight("LH1", "2026-02-28T07:00")])
+
+    first = await alternatives()
+    first["flights"][0]["status"] = "mutated"
+    second = await alternatives()
+
+    assert len(client.calls) == 1
+    assert second["flights"] == [flight("LH1", "2026-02-28T07:00")]
+
+
+# ----------------------------------------
+# Session cache of alternatives
+# ----------------------------------------
+
+class RecordingState(dict):
+    """Dict that records which keys were assigned, like an event's state delta."""
+
+    def __init__(self):
+        super().__init__()
+        self.assigned = []
+
+    def __setitem__(self, key, value):
+        self.assigned.append(key)
+        super().__setitem__(key, value)
+
+
+@pytest.mark.asyncio
+async def test_alternatives_are_cached_one_state_key_per_query(route):
+    client = route([flight("LH1", "2026-02-28T07:00")])
+    ctx = SimpleNamespace(state=RecordingState())
+
+    first = await alternatives(tool_context=ctx)
+    second = await alternatives(tool_context=ctx)
+
+    assert second == first
+    assert len(client.calls) == 1
+    alt_key = "HAM|JFK|2026-02-28|False|business"
+    assert ctx.state[tools._ALT_CACHE_PREFIX + alt_key][1] == first
+    assert "_alt_cache" not in ctx.state
+
+
+@pytest.mark.asyncio
+async def test_alternatives_cache_write_is_a_small_delta(route, monkeypatch):
+    monkeypatch.setattr(tools, "_ALT_CACHE_MAX", 2)
+    route([flight("LH1", "2026-02-28T07:00")])
+    ctx = SimpleNamespace(state=RecordingState())
+
+    for date in ("2026-02-01", "2026-02-02", "2026-02-03"):
+        ctx.state.assigned.clear()
+        await tools.find_alternative_flights("HAM", "JFK", date, tool_context=ctx)
+
+    prefix = tools._ALT_CACHE_PREFIX
+    # Only the new entry, the oldest one's eviction, the index and the result
+    assert sorted(ctx.state.assigned) == sorted([
+        prefix + "HAM|JFK|2026-02-01|False|business",
+        tools._ALT_CACHE_KEYS,
+        prefix + "HAM|JFK|2026-02-03|False|business",
+        "alternatives",
+    ])
+    assert ctx.state[prefix + "HAM|JFK|2026-02-01|False|business"] is None
+    assert len(ctx.state[tools._ALT_CACHE_KEYS]) == 2
@@ -0,0 +1,345 @@
+"""Tests for LufthansaAPIClient request retries and token handling."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import aiohttp
+import orjson
+import pytest
+
+from travel_buddy.tools import lufthansa_api
+from travel_buddy.tools.lufthansa_api import LufthansaAPIClient
+
+
+class FakeResponse:
+    def __init__(self, status, body=None):
+        self.status = status
+        self._body = orjson.dumps(body if body is not None else {"status": status})
+
+    async def read(self):
+        return self._body
+
+    async def text(self):
+        return self._body.decode()
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                SimpleNamespace(real_url="https://api.test"), (), status=self.status
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Serves the queued responses (or raises queued exceptions) in order."""
+
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.auth_headers = []
+
+    def request(self, method, url, headers=None, params=None):
+        self.auth_headers.append(headers["Authorization"])
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def close(self):
+        self.closed = True
+
+
+def make_client(responses=(), token="token-1", expires_in=3600):
+    """Client wired to a FakeSession, holding a token and no background refresher."""
+    loop = asyncio.get_running_loop()
+    client = LufthansaAPIClient()
+    client._session = FakeSession(responses)
+    client._session_loop = loop
+    client._token_lock = asyncio.Lock()
+    # A pending future stands in for the refresher task
+    client._refresher = loop.create_future()
+    if token:
+        client._set_token(token, time.time() + expires_in)
+
+    client.fetches = 0
+
+    async def fetch_token(session):
+        client.fetches += 1
+        client._set_token(f"fetched-{client.fetches}", time.time() + 3600)
+        await client._publish_shared_token(3600)
+
+    client._fetch_token = fetch_token
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(lufthansa_api.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [502, 503, 504])
+async def test_gateway_errors_are_retried_with_backoff(sleeps, status):
+    client = make_client([FakeResponse(status), FakeResponse(status), FakeResponse(200, {"ok": 1})])
+
+    assert await client._make_request("GET", "/flight") == {"ok": 1}
+    assert len(client._session.auth_headers) == 3
+    assert sleeps == [0.2, 0.4]
+
+
+@pytest.mark.asyncio
+async def test_gateway_error_raises_once_retries_are_spent(sleeps):
+    client = make_client([FakeResponse(503)] * 3)
+
+    with pytest.raises(aiohttp.ClientResponseError) as e:
+        await client._make_request("GET", "/flight")
+    assert e.value.status == 503
+    assert len(client._session.auth_headers) == 1 + lufthansa_api._MAX_RETRIES
+    assert sleeps == [0.2, 0.4]
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried(sleeps):
+    client = make_client([FakeResponse(500)])
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await client._make_request("GET", "/flight")
+    assert len(client._session.auth_headers) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_retried(sleeps):
+    client = make_client([aiohttp.ClientConnectionError("reset"), FakeResponse(200, {"ok": 1})])
+
+    assert await client._make_request("GET", "/flight") == {"ok": 1}
+    assert sleeps == [0.2]
+
+
+# ----------------------------------------
+# Token sharing through Redis
+# ----------------------------------------
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def share_redis(client, server):
+    from redis.exceptions import RedisError
+
+    client._redis = fakeredis.FakeAsyncRedis(server=server)
+    client._redis_errors = (RedisError, OSError)
+
+
+@pytest.mark.asyncio
+async def test_published_token_is_adopted_without_fetching():
+    server = fakeredis.FakeServer()
+    first, second = make_client(token=None), make_client(token=None)
+    share_redis(first, server)
+    share_redis(second, server)
+
+    assert await first._refresh_token(min_ttl=5) == "fetched-1"
+    assert await second._refresh_token(min_ttl=5) == "fetched-1"
+    assert (first.fetches, second.fetches) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_fetch_once(monkeypatch):
+    monkeypatch.setattr(lufthansa_api, "_SHARED_TOKEN_POLL", 0.01)
+    server = fakeredis.FakeServer()
+    clients = [make_client(token=None) for _ in range(3)]
+    for client in clients:
+        share_redis(client, server)
+        fetch = client._fetch_token
+
+        async def slow_fetch(session, fetch=fetch):
+            await asyncio.sleep(0.05)
+            await fetch(session)
+
+        client._fetch_token = slow_fetch
+
+    tokens = await asyncio.gather(*(c._refresh_token(min_ttl=5) for c in clients))
+
+    assert len(set(tokens)) == 1
+    assert sum(c.fetches for c in clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_held_lock_that_never_publishes_falls_back_to_fetching(monkeypatch):
+    monkeypatch.setattr(lufthansa_api, "_SHARED_TOKEN_WAIT", 0.05)
+    monkeypatch.setattr(lufthansa_api, "_SHARED_TOKEN_POLL", 0.01)
+    client = make_client(token=None)
+    share_redis(client, fakeredis.FakeServer())
+    await client._redis.set(client._token_lock_key, "someone-else")
+
+    assert await client._refresh_token(min_ttl=5) == "fetched-1"
+    # The other owner's lock is left alone
+    assert await client._redis.get(client._token_lock_key) == b"someone-else"
+
+
+# ----------------------------------------
+# 401 handling
+# ----------------------------------------
+
+@pytest.mark.asyncio
+async def test_401_refreshes_once_and_retries(sleeps):
+    client = make_client([FakeResponse(401), FakeResponse(200, {"ok": 1})])
+
+    assert await client._make_request("GET", "/flight") == {"ok": 1}
+    assert client.fetches == 1
+    assert client._session.auth_headers == ["Bearer token-1", "Bearer fetched-1"]
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_second_401_raises_instead_of_looping(sleeps):
+    client = make_client([FakeResponse(401), FakeResponse(401)])
+
+    with pytest.raises(aiohttp.ClientResponseError) as e:
+        await client._make_request("GET", "/flight")
+    assert e.value.status == 401
+    assert client.fetches == 1
+    assert len(client._session.auth_headers) == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_not_readopted_from_redis():
+    client = make_client([FakeResponse(401), FakeResponse(200, {"ok": 1})])
+    share_redis(client, fakeredis.FakeServer())
+    await client._redis.set(
+        client._token_key,
+        orjson.dumps({"access_token": "token-1", "expires_at": time.time() + 3600}),
+    )
+
+    assert await client._make_request("GET", "/flight") == {"ok": 1}
+    assert client._session.auth_headers == ["Bearer token-1", "Bearer fetched-1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("expires_in, fetches", [(7, 0), (3, 1)])
+async def test_token_is_refreshed_within_5s_of_expiry(expires_in, fetches):
+    assert lufthansa_api._TOKEN_EXPIRY_MARGIN == 5
+    client = make_client([FakeResponse(200)], expires_in=expires_in)
+
+    await client._make_request("GET", "/flight")
+    assert client.fetches == fetches
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_fetches_without_waiting(monkeypatch):
+    async def no_wait(min_ttl):
+        raise AssertionError("waited for a shared token with Redis down")
+
+    client = make_client(token=None)
+    server = fakeredis.FakeServer()
+    server.connected = False
+    share_redis(client, server)
+    monkeypatch.setattr(client, "_wait_for_shared_token", no_wait)
+
+    assert await client._refresh_token(min_ttl=5) == "fetched-1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"access_token": "shared", "expires_at": "tomorrow"},
+        {"access_token": "shared", "expires_at": None},
+        {"access_token": None, "expires_at": 2**40},
+        ["not", "a", "dict"],
+    ],
+)
+async def test_malformed_shared_token_is_a_cache_miss(record):
+    client = make_client(token=None)
+    share_redis(client, fakeredis.FakeServer())
+    await client._redis.set(client._token_key, orjson.dumps(record))
+
+    assert await client._refresh_token(min_ttl=5) == "fetched-1"
+
+
+def test_malformed_token_file_is_a_cache_miss(tmp_path, monkeypatch):
+    path = tmp_path / "token.json"
+    path.write_bytes(orjson.dumps({
+        "client_id": "test-client", "access_token": "disk", "expires_at": "soon",
+    }))
+    monkeypatch.setattr(lufthansa_api, "LH_TOKEN_CACHE_PATH", str(path))
+
+    client = LufthansaAPIClient()
+    assert client._access_token is None
+
+
+def test_token_file_is_reused(tmp_path, monkeypatch):
+    path = tmp_path / "token.json"
+    monkeypatch.setattr(lufthansa_api, "LH_TOKEN_CACHE_PATH", str(path))
+    first = LufthansaAPIClient()
+    first._set_token("disk", time.time() + 3600)
+    first._save_cached_token()
+
+    assert LufthansaAPIClient()._access_token == "disk"
+
+
+# ----------------------------------------
+# Response cache
+# ----------------------------------------
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_copied_per_caller():
+    body = {"AirportResource": {"Airports": {"Airport": {"AirportCode": "FRA"}}}}
+    client = make_client([FakeResponse(200, body)])
+
+    first, second = await asyncio.gather(client.get_airport("FRA"), client.get_airport("FRA"))
+    first["AirportResource"]["Airports"] = "mutated"
+    third = await client.get_airport("FRA")
+
+    assert second == body
+    assert third == body
+    assert len(client._session.auth_headers) == 1
+
+
+@pytest.mark.asyncio
+async def test_unparsed_flight_status_does_not_expose_the_cache():
+    body = {"FlightStatusResource": {"Flights": {"Flight": ["unexpected"]}}}
+    client = make_client([FakeResponse(200, body)])
+
+    first = await client.get_flight_status("LH400", "2026-02-28")
+    first["raw"]["FlightStatusResource"] = "mutated"
+    second = await client.get_flight_status("LH400", "2026-02-28")
+
+    assert second["raw"] == body
+
+
+# ----------------------------------------
+# Parsing
+# ----------------------------------------
+
+def route_response(*airlines):
+    return {"FlightStatusResource": {"Flights": {"Flight": [
+        {"MarketingCarrier": {"AirlineID": airline, "FlightNumber": str(i)}}
+        for i, airline in enumerate(airlines)
+    ]}}}
+
+
+def test_route_flights_are_filtered_by_airline():
+    client = LufthansaAPIClient()
+    response = route_response("LH", "UA", "LX")
+
+    filtered = client._parse_route_flights(response, airline_codes=("LH", "LX"))
+    unfiltered = client._parse_route_flights(response)
+
+    assert [f["flight"] for f in filtered["flights"]] == ["LH0", "LX2"]
+    assert filtered["filtered"] is True
+    assert [f["flight"] for f in unfiltered["flights"]] == ["LH0", "UA1", "LX2"]
+    assert "filtered" not in unfiltered
@@ -0,0 +1,125 @@
+"""Tests for RedisSessionService, run against fakeredis."""
+
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+from travel_buddy.shared_libraries import RedisSessionService
+
+APP = "travel_buddy"
+USER = "traveler"
+
+
+@pytest.fixture
+def service():
+    svc = RedisSessionService(url="redis://localhost:6379/0", ttl=60)
+    svc._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    return svc
+
+
+def _event(text: str, **state_delta) -> Event:
+    return Event(
+        author="user",
+        invocation_id=text,
+        actions=EventActions(state_delta=state_delta),
+    )
+
+
+@pytest.mark.asyncio
+async def test_round_trip(service):
+    session = await service.create_session(
+        app_name=APP, user_id=USER, session_id="s1", state={"home": "FRA"}
+    )
+    await service.append_event(session, _event("e1", current_flight={"fn": "LH400"}))
+    await service.append_event(session, _event("e2", **{"temp:scratch": 1}))
+
+    loaded = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+    assert loaded.state == {"home": "FRA", "current_flight": {"fn": "LH400"}}
+    assert [e.invocation_id for e in loaded.events] == ["e1", "e2"]
+    assert loaded.last_update_time == session.last_update_time
+
+    recent = await service.get_session(
+        app_name=APP, user_id=USER, session_id="s1",
+        config=GetSessionConfig(num_recent_events=1),
+    )
+    assert [e.invocation_id for e in recent.events] == ["e2"]
+
+    none = await service.get_session(
+        app_name=APP, user_id=USER, session_id="s1",
+        config=GetSessionConfig(num_recent_events=0),
+    )
+    assert none.events == []
+
+
+@pytest.mark.asyncio
+async def test_list_and_delete(service):
+    await service.create_session(app_name=APP, user_id=USER, session_id="a")
+    session = await service.create_session(app_name=APP, user_id=USER, session_id="b")
+    await service.append_event(session, _event("e1", k="v"))
+
+    listed = await service.list_sessions(app_name=APP, user_id=USER)
+    assert sorted(s.id for s in listed.sessions) == ["a", "b"]
+    assert all(s.events == [] for s in listed.sessions)
+
+    await service.delete_session(app_name=APP, user_id=USER, session_id="b")
+    assert await service.get_session(app_name=APP, user_id=USER, session_id="b") is None
+    assert await service._redis.keys("*b") == []
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_across_users(service):
+    await service.create_session(app_name=APP, user_id="alice", session_id="a")
+    await service.create_session(app_name=APP, user_id="bob:x", session_id="b")
+    await service.create_session(app_name="other", user_id="alice", session_id="c")
+
+    listed = await service.list_sessions(app_name=APP)
+    assert sorted((s.user_id, s.id) for s in listed.sessions) == [
+        ("alice", "a"),
+        ("bob:x", "b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_matches_names_literally(service):
+    await service.create_session(app_name="app*", user_id="u[1]", session_id="a")
+    await service.create_session(app_name="app1", user_id="u1", session_id="b")
+    await service.create_session(app_name="app*", user_id="u?", session_id="c")
+
+    listed = await service.list_sessions(app_name="app*", user_id="u[1]")
+    assert [s.id for s in listed.sessions] == ["a"]
+    listed = await service.list_sessions(app_name="app*")
+    assert sorted(s.id for s in listed.sessions) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_appends_keep_all_writes(service):
+    await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    # Two runs holding their own snapshot of the same session
+    first = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+    second = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+
+    await asyncio.gather(
+        service.append_event(first, _event("chat", email_drafts=["draft"])),
+        service.append_event(second, _event("quick", current_flight={"fn": "LH400"})),
+    )
+
+    loaded = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+    assert loaded.state == {"email_drafts": ["draft"], "current_flight": {"fn": "LH400"}}
+    assert sorted(e.invocation_id for e in loaded.events) == ["chat", "quick"]
+
+
+@pytest.mark.asyncio
+async def test_partial_events_are_not_stored(service):
+    session = await service.create_session(app_name=APP, user_id=USER, session_id="s1")
+    partial = _event("p", k="v")
+    partial.partial = True
+    await service.append_event(session, partial)
+
+    loaded = await service.get_session(app_name=APP, user_id=USER, session_id="s1")
+    assert loaded.events == []
+    assert loaded.state == {}
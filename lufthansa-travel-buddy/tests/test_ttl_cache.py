@@ -0,0 +1,59 @@
+"""Tests for TTLCache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from travel_buddy.shared_libraries import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        "travel_buddy.shared_libraries.ttl_cache.time",
+        SimpleNamespace(monotonic=lambda: now[0]),
+    )
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("k", "v")
+
+    clock[0] += 59.9
+    assert cache.get("k") == "v"
+
+    clock[0] += 0.1
+    assert cache.get("k") is None
+    assert cache.get("k", "default") == "default"
+
+
+def test_set_refreshes_expiry(clock):
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("k", "old")
+    clock[0] += 50
+    cache.set("k", "new")
+    clock[0] += 50
+
+    assert cache.get("k") == "new"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_clear(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.clear()
+
+    assert cache.get("a") is None
@@ -4,9 +4,10 @@ Lufthansa Business Travel Buddy - ADK Agent Package
 Proactive disruption manager for Lufthansa business travelers.
 Built for Hamburg Hackathon: Innovate the Skies & Beyond (Feb 28, 2026)
 
-This package exports `root_agent` which is required by ADK to discover the agent.
+This package exports `root_agent` which is required by ADK to discover the agent,
+and `app`, which wraps it with app-level settings such as context caching.
 """
 
-from .agent import root_agent
+from .agent import app, root_agent
 
-__all__ = ["root_agent"]
+__all__ = ["app", "root_agent"]
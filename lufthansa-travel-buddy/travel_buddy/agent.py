@@ -16,10 +16,17 @@ Design Pattern: Coordinator + ReAct
 """
 
 from google.adk.agents import Agent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
 from google.adk.tools import google_search
 
-from .config import ROOT_AGENT_MODEL
+from .config import (
+    ROOT_AGENT_MODEL,
+    CONTEXT_CACHE_TTL_SECONDS,
+    CONTEXT_CACHE_MIN_TOKENS,
+)
 from .prompts import ROOT_AGENT_INSTRUCTION
+from .shared_libraries import async_tool, timed
 
 # Import domain-specific tools
 from .sub_agents.flight.tools import (
@@ -31,6 +38,7 @@ from .sub_agents.flight.tools import (
 )
 from .sub_agents.calendar.tools import (
     get_calendar_events,
+    get_critical_meetings,
     find_meeting_conflicts,
 )
 from .sub_agents.comms.tools import (
@@ -40,6 +48,11 @@ from .sub_agents.comms.tools import (
 )
 
 
+def _tool(fn):
+    """Prepare a tool for registration: keep it off the event loop and time it."""
+    return timed(async_tool(fn))
+
+
 # ============================================
 # Root Agent Definition
 # ============================================
@@ -52,6 +65,12 @@ from .sub_agents.comms.tools import (
 #
 # Tools act as "pseudo-agents" - the coordinator decides
 # which tool to use based on the current context.
+#
+# Independent tools are requested together in one ACTION step
+# (see ROOT_AGENT_INSTRUCTION); ADK dispatches the function calls of
+# a single model response concurrently. Synchronous tools are wrapped
+# with async_tool so their blocking I/O runs in worker threads and the
+# calls actually overlap; timed records each tool's latency.
 # ============================================
 
 root_agent = Agent(
@@ -75,33 +94,55 @@ root_agent = Agent(
         # --------------------------------
         # Flight Domain Tools (Lufthansa API)
         # --------------------------------
-        check_flight_status,        # Get real-time flight status
-        find_alternative_flights,   # Find rebooking options
-        get_flight_details,         # Get detailed flight info
-        get_airport_departures,     # Get departures from airport
-        get_airport_arrivals,       # Get arrivals at airport
+        _tool(check_flight_status),       # Get real-time flight status
+        _tool(find_alternative_flights),  # Find rebooking options
+        _tool(get_flight_details),        # Get detailed flight info
+        _tool(get_airport_departures),    # Get departures from airport
+        _tool(get_airport_arrivals),      # Get arrivals at airport
         
         # --------------------------------
         # Calendar Domain Tools
         # --------------------------------
-        get_calendar_events,        # Retrieve calendar events
-        find_meeting_conflicts,     # Analyze meeting impacts
+        _tool(get_calendar_events),       # Retrieve calendar events
+        _tool(get_critical_meetings),     # Critical meetings only
+        _tool(find_meeting_conflicts),    # Analyze meeting impacts
         
         # --------------------------------
         # Communication Domain Tools
         # --------------------------------
-        draft_delay_notification,   # Draft delay emails
-        draft_reschedule_request,   # Draft reschedule requests
+        _tool(draft_delay_notification),  # Draft delay emails
+        _tool(draft_reschedule_request),  # Draft reschedule requests
         
         # --------------------------------
         # Search Grounding (Built-in)
         # --------------------------------
-        google_search,            # Real-time web search for context
-        send_email,              # Tool to send emails directly
+        google_search,                    # Real-time web search for context
+        _tool(send_email),                # Tool to send emails directly
     ],
 )
 
 
+# ============================================
+# App Definition - Context Caching
+# ============================================
+#
+# ROOT_AGENT_INSTRUCTION and the tool declarations are identical on
+# every turn. ADK stores them (plus the stable history prefix) as
+# Gemini cached content and references it from later requests, so
+# those tokens are not re-processed per turn. ADK fingerprints the
+# instruction and tools and only creates a new cache when they change.
+# ============================================
+
+app = App(
+    name="lufthansa_travel_buddy",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+        min_tokens=CONTEXT_CACHE_MIN_TOKENS,
+    ),
+)
+
+
 # ============================================
 # Alternative: Multi-Agent Architecture (for v2)
 # ============================================
@@ -43,18 +43,49 @@ LUFTHANSA_CLIENT_SECRET = get_env_var("LUFTHANSA_CLIENT_SECRET", required=True)
 ROOT_AGENT_MODEL = get_env_var("ROOT_AGENT_MODEL", "gemini-3.1-pro-preview")
 SUB_AGENT_MODEL = get_env_var("SUB_AGENT_MODEL", "gemini-3.1-pro-preview")
 
+# Gemini context caching of the system instruction, tools and history
+# prefix. Requests below CONTEXT_CACHE_MIN_TOKENS are sent uncached.
+CONTEXT_CACHE_TTL_SECONDS = int(get_env_var("CONTEXT_CACHE_TTL_SECONDS", "3600"))
+CONTEXT_CACHE_MIN_TOKENS = int(get_env_var("CONTEXT_CACHE_MIN_TOKENS", "4096"))
+
 # ============================================
 # Lufthansa API URLs
 # ============================================
 LUFTHANSA_API_BASE_URL = "https://api.lufthansa.com/v1"
 LUFTHANSA_AUTH_URL = "https://api.lufthansa.com/v1/oauth/token"
 
+# Maximum concurrent requests to the Lufthansa API (rate limit guard)
+LH_MAX_PARALLEL = int(get_env_var("LH_MAX_PARALLEL", "8"))
+
+# OAuth token persisted across restarts; set to an empty string to disable
+LH_TOKEN_CACHE_PATH = os.path.expanduser(
+    get_env_var("LH_TOKEN_CACHE_PATH", "~/.cache/lufthansa_travel_buddy/token.json")
+)
+
 # ============================================
 # Fallback Aviation API
 # ============================================
 AVIATIONSTACK_API_KEY = get_env_var("AVIATIONSTACK_API_KEY")
 AVIATIONSTACK_BASE_URL = "https://api.aviationstack.com/v1"
 
+# ============================================
+# Session Storage
+# ============================================
+# When set, chat sessions are kept in Redis instead of process memory
+REDIS_URL = get_env_var("REDIS_URL")
+SESSION_TTL_SECONDS = int(get_env_var("SESSION_TTL_SECONDS", "86400"))
+
+# ============================================
+# Outgoing Email (SMTP)
+# ============================================
+# When SMTP_HOST is unset, send_email only simulates delivery
+SMTP_HOST = get_env_var("SMTP_HOST")
+SMTP_PORT = int(get_env_var("SMTP_PORT", "587"))
+SMTP_USERNAME = get_env_var("SMTP_USERNAME")
+SMTP_PASSWORD = get_env_var("SMTP_PASSWORD")
+SMTP_SENDER = get_env_var("SMTP_SENDER", SMTP_USERNAME)
+SMTP_USE_TLS = get_env_var("SMTP_USE_TLS", "1") == "1"
+
 # ============================================
 # Supported Airlines
 # ============================================
@@ -31,10 +31,17 @@ Assess the situation:
 Gather information using your tools:
 - `check_flight_status` - Get real-time delay/cancellation info
 - `find_alternative_flights` - Find rebooking options (business class priority)
+- `get_critical_meetings` - First pass: only the meetings that cannot be missed
 - `get_calendar_events` - See meetings that may be impacted
 - `find_meeting_conflicts` - Analyze which meetings are at risk
 - `google_search` - Get context (weather, strikes, airport status)
 
+Issue independent tool calls in a single ACTION step. For example,
+`check_flight_status`, `get_calendar_events` and `google_search` do not
+depend on each other - call them together rather than one after another.
+Only wait for a result when the next call needs it (e.g. `find_meeting_conflicts`
+needs the new arrival time).
+
 ### OBSERVATION
 Evaluate impact:
 - Which meetings are at risk?
@@ -1 +1,16 @@
 """Shared utilities and helpers."""
+
+from .async_tools import async_tool
+from .latency import LATENCIES, latency_summary, record_latency, timed
+from .redis_session_service import RedisSessionService
+from .ttl_cache import TTLCache
+
+__all__ = [
+    "async_tool",
+    "LATENCIES",
+    "latency_summary",
+    "record_latency",
+    "timed",
+    "RedisSessionService",
+    "TTLCache",
+]
@@ -0,0 +1,35 @@
+"""
+Async Tool Wrappers
+
+Helpers for registering synchronous tool functions with ADK
+without blocking the event loop.
+"""
+
+import asyncio
+import functools
+import inspect
+
+
+def async_tool(fn):
+    """
+    Wrap a synchronous tool so ADK awaits it in a worker thread.
+    
+    ADK calls synchronous tools directly on the event loop, so a slow
+    HTTP or SMTP call stalls token streaming and every other tool call
+    of the same model response. The wrapper keeps the name, docstring
+    and signature ADK uses to build the function declaration.
+    
+    Args:
+        fn: Tool function. Coroutine functions are returned unchanged.
+    
+    Returns:
+        Coroutine function running `fn` via asyncio.to_thread
+    """
+    if inspect.iscoroutinefunction(fn):
+        return fn
+    
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    
+    return wrapper
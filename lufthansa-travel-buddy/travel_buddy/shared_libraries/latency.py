@@ -0,0 +1,67 @@
+"""
+Latency Instrumentation
+
+Lightweight per-stage timing for tool calls and agent turns, used to
+see whether the Lufthansa API, Gemini or rendering dominates a slow
+turn. Samples are kept per process in bounded windows.
+"""
+
+import functools
+import inspect
+import time
+from collections import defaultdict, deque
+
+# Most recent samples (seconds) kept per stage
+_MAX_SAMPLES = 200
+
+LATENCIES: dict = defaultdict(lambda: deque(maxlen=_MAX_SAMPLES))
+
+
+def record_latency(name: str, seconds: float) -> None:
+    """Record one latency sample for a stage."""
+    LATENCIES[name].append(seconds)
+
+
+def timed(fn):
+    """
+    Wrap a tool so each call's wall time is recorded under its name.
+    
+    The wrapper is a coroutine function either way, and keeps the
+    name, docstring and signature ADK reads from the tool.
+    """
+    is_async = inspect.iscoroutinefunction(fn)
+    
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            if is_async:
+                return await fn(*args, **kwargs)
+            return fn(*args, **kwargs)
+        finally:
+            record_latency(fn.__name__, time.perf_counter() - start)
+    
+    return wrapper
+
+
+def latency_summary() -> list:
+    """
+    Summarize recorded latencies.
+    
+    Returns:
+        list: One row per stage with call count, mean and max in ms,
+              slowest mean first
+    """
+    rows = []
+    for name, samples in list(LATENCIES.items()):
+        samples = list(samples)
+        if not samples:
+            continue
+        rows.append({
+            "stage": name,
+            "calls": len(samples),
+            "avg_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "max_ms": round(max(samples) * 1000, 1),
+        })
+    rows.sort(key=lambda row: row["avg_ms"], reverse=True)
+    return rows
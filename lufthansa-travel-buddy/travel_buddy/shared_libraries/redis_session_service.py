@@ -0,0 +1,206 @@
+"""
+Redis Session Service
+
+ADK session service backed by Redis, so conversations survive
+Streamlit restarts and are shared by every app instance.
+
+Requires the optional `redis` package (redis-py >= 5).
+"""
+
+import json
+import logging
+import re
+import time
+import uuid
+from typing import Any, Optional
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+_GLOB_SPECIAL = re.compile(r"([*?\[\]\\])")
+
+
+def _escape_glob(text: str) -> str:
+    """Escape Redis glob metacharacters so `text` matches literally."""
+    return _GLOB_SPECIAL.sub(r"\\\1", text)
+
+
+class RedisSessionService(BaseSessionService):
+    """
+    Session service storing each session as three Redis keys.
+    
+    - `sess:{app_name}:{user_id}:{session_id}`: hash with session metadata
+    - `sess_state:...`: hash of state key -> JSON value
+    - `sess_events:...`: list of event JSON, oldest first
+    
+    append_event only RPUSHes the new event and HSETs its state delta, so
+    overlapping runs on one session both keep their writes and the cost
+    of an append doesn't grow with the history. All keys expire `ttl`
+    seconds after the last write. `app:`/`user:` prefixed state keys are
+    stored with the session rather than shared across sessions.
+    
+    Usage:
+        session_service = RedisSessionService(url="redis://localhost:6379/0")
+    """
+    
+    def __init__(self, url: str, ttl: int = 86400):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise ImportError(
+                "RedisSessionService requires the 'redis' package: pip install redis"
+            ) from e
+        
+        self._redis = aioredis.Redis.from_url(url, decode_responses=True)
+        self._ttl = ttl
+    
+    @staticmethod
+    def _keys(app_name: str, user_id: str, session_id: str) -> tuple[str, str, str]:
+        """Return the (meta, state, events) keys of a session."""
+        suffix = f"{app_name}:{user_id}:{session_id}"
+        return f"sess:{suffix}", f"sess_state:{suffix}", f"sess_events:{suffix}"
+    
+    def _expire_all(self, pipe, keys: tuple[str, str, str]) -> None:
+        for key in keys:
+            pipe.expire(key, self._ttl)
+    
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = Session(
+            id=session_id.strip() if session_id else str(uuid.uuid4()),
+            app_name=app_name,
+            user_id=user_id,
+            state=state or {},
+            last_update_time=time.time(),
+        )
+        keys = self._keys(app_name, user_id, session.id)
+        meta_key, state_key, _ = keys
+        
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(meta_key, mapping={
+                "user_id": user_id,
+                "id": session.id,
+                "last_update_time": session.last_update_time,
+            })
+            if session.state:
+                pipe.hset(
+                    state_key,
+                    mapping={k: json.dumps(v) for k, v in session.state.items()},
+                )
+            self._expire_all(pipe, keys)
+            await pipe.execute()
+        return session
+    
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        meta_key, state_key, events_key = self._keys(app_name, user_id, session_id)
+        
+        # Only the newest events are transferred when a limit is given;
+        # LRANGE has no empty "last 0" range, so 0 is handled below
+        limit = config.num_recent_events if config else None
+        
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(meta_key)
+            pipe.hgetall(state_key)
+            pipe.lrange(events_key, -limit if limit else 0, -1)
+            meta, state, raw_events = await pipe.execute()
+        if not meta:
+            return None
+        if limit == 0:
+            raw_events = []
+        
+        events = [Event.model_validate_json(raw) for raw in raw_events]
+        if config and config.after_timestamp:
+            events = [e for e in events if e.timestamp >= config.after_timestamp]
+        
+        return Session(
+            id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state={k: json.loads(v) for k, v in state.items()},
+            events=events,
+            last_update_time=float(meta["last_update_time"]),
+        )
+    
+    async def list_sessions(
+        self,
+        *,
+        app_name: str,
+        user_id: Optional[str] = None,
+    ) -> ListSessionsResponse:
+        """List sessions without events, for one user or (user_id None) all users."""
+        sessions = []
+        if user_id is None:
+            prefix = f"sess:{app_name}:"
+        else:
+            prefix = self._keys(app_name, user_id, "")[0]
+        async for meta_key in self._redis.scan_iter(match=_escape_glob(prefix) + "*"):
+            if user_id is None:
+                # Ids may contain ':', so they are read from the hash
+                # rather than split out of the key
+                owner, session_id = await self._redis.hmget(meta_key, "user_id", "id")
+                if owner is None or session_id is None:
+                    continue
+            else:
+                owner, session_id = user_id, meta_key[len(prefix):]
+            session = await self.get_session(
+                app_name=app_name,
+                user_id=owner,
+                session_id=session_id,
+                config=GetSessionConfig(num_recent_events=0),
+            )
+            if session is not None:
+                sessions.append(session)
+        return ListSessionsResponse(sessions=sessions)
+    
+    async def delete_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> None:
+        await self._redis.delete(*self._keys(app_name, user_id, session_id))
+    
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        if event.partial:
+            return event
+        
+        session.last_update_time = event.timestamp
+        keys = self._keys(session.app_name, session.user_id, session.id)
+        meta_key, state_key, events_key = keys
+        
+        # Append-only: write just this event and the keys it changed, never
+        # the caller's whole (possibly stale) session snapshot
+        state_delta = {
+            k: json.dumps(v)
+            for k, v in (event.actions.state_delta or {}).items()
+            if not k.startswith("temp:")
+        }
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(events_key, event.model_dump_json())
+            if state_delta:
+                pipe.hset(state_key, mapping=state_delta)
+            pipe.hset(meta_key, mapping={"last_update_time": event.timestamp})
+            self._expire_all(pipe, keys)
+            await pipe.execute()
+        return event
@@ -0,0 +1,57 @@
+"""
+TTL Cache
+
+Small thread-safe, size-bounded cache whose entries expire after a
+fixed time-to-live. Used to memoize upstream API lookups that are
+re-asked within seconds during an agent session.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Least-recently-used cache with per-entry expiry.
+    
+    Usage:
+        cache = TTLCache(maxsize=512, ttl=60)
+        value = cache.get(key)
+        if value is None:
+            value = fetch()
+            cache.set(key, value)
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key`, evicting the least recently used entries."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
@@ -2,10 +2,12 @@
 
 from .tools import (
     get_calendar_events,
+    get_critical_meetings,
     find_meeting_conflicts,
 )
 
 __all__ = [
     "get_calendar_events",
+    "get_critical_meetings",
     "find_meeting_conflicts",
 ]
@@ -5,7 +5,11 @@ Tools for reading calendar events and finding conflicts.
 In production, integrate with Google Calendar MCP or Microsoft Graph API.
 """
 
+import bisect
+import functools
 import logging
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Optional
 
 from google.adk.tools import ToolContext
@@ -78,6 +82,121 @@ MOCK_CALENDAR = {
 }
 
 
+def _to_minutes(hhmm: str) -> int:
+    """Convert an HH:MM string to minutes after midnight."""
+    hour, minute = map(int, hhmm.split(":"))
+    return hour * 60 + minute
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """Calendar event with start/end precomputed as minutes after midnight."""
+    id: str
+    title: str
+    start: str
+    end: str
+    start_min: int
+    end_min: int
+    timezone: str
+    location: str
+    priority: str
+    attendees: tuple
+    description: str
+    
+    @classmethod
+    def from_dict(cls, event: dict) -> "Event":
+        return cls(
+            id=event["id"],
+            title=event["title"],
+            start=event["start"],
+            end=event["end"],
+            start_min=_to_minutes(event["start"]),
+            end_min=_to_minutes(event["end"]),
+            timezone=event["timezone"],
+            location=event["location"],
+            priority=event["priority"],
+            attendees=tuple(event["attendees"]),
+            description=event["description"],
+        )
+    
+    def as_dict(self) -> dict:
+        """Return the event in the dict shape returned by the tools."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "start": self.start,
+            "end": self.end,
+            "timezone": self.timezone,
+            "location": self.location,
+            "priority": self.priority,
+            "attendees": list(self.attendees),
+            "description": self.description,
+        }
+
+
+# Events per date in source order, as get_calendar_events returns them
+_EVENTS: dict[str, tuple[Event, ...]] = {
+    date: tuple(Event.from_dict(e) for e in events)
+    for date, events in MOCK_CALENDAR.items()
+}
+
+# The same events sorted by start time, with the matching start minutes
+# kept in a parallel list for bisect
+_CALENDAR: dict[str, tuple[Event, ...]] = {
+    date: tuple(sorted(events, key=lambda e: e.start_min))
+    for date, events in _EVENTS.items()
+}
+_CAL_STARTS: dict[str, list[int]] = {
+    date: [event.start_min for event in events]
+    for date, events in _CALENDAR.items()
+}
+
+# Events per (date, priority), in start-time order
+_BY_PRIORITY: dict[tuple[str, str], tuple[Event, ...]] = defaultdict(tuple)
+for _date, _events in _CALENDAR.items():
+    for _event in _events:
+        _BY_PRIORITY[(_date, _event.priority)] += (_event,)
+_BY_PRIORITY = dict(_BY_PRIORITY)
+
+
+# Lookups below are pure over the calendar source. When a tool that
+# mutates the calendar is added, it must call .cache_clear() on both.
+
+@functools.lru_cache(maxsize=256)
+def _events_cached(date: str) -> tuple:
+    """
+    Return the events for a date as a tuple of Event, in source order.
+    
+    Events are frozen, so the cached tuple is safe to share; callers
+    build fresh dicts with as_dict() rather than sharing mutable ones.
+    """
+    return _EVENTS.get(date, ())
+
+
+@functools.lru_cache(maxsize=512)
+def _conflicts_cached(date: str, available_total: int) -> tuple:
+    """
+    Split a date's events around the earliest available minute.
+    
+    Returns:
+        tuple: (conflicts, at_risk, safe) tuples of Event
+    """
+    starts = _CAL_STARTS.get(date, [])
+    events = _CALENDAR.get(date, ())
+    
+    # Events are sorted by start, so each bucket is a contiguous slice:
+    # starting before available_total -> will miss,
+    # starting less than 30 min after it -> at risk, the rest -> safe
+    conflict_end = bisect.bisect_left(starts, available_total)
+    at_risk_end = bisect.bisect_left(starts, available_total + 30)
+    
+    return (
+        events[:conflict_end],
+        events[conflict_end:at_risk_end],
+        events[at_risk_end:],
+    )
+
+
 def get_calendar_events(
     date: str,
     user_id: str = "default",
@@ -110,7 +229,7 @@ def get_calendar_events(
             ]
         }
     """
-    logger.info(f"Getting calendar events for {date}")
+    logger.info("Getting calendar events for %s", date)
     
     # TODO: Replace with Google Calendar MCP call
     # Example with MCP:
@@ -120,7 +239,7 @@ def get_calendar_events(
     #     time_max=f"{date}T23:59:59Z",
     # )
     
-    events = MOCK_CALENDAR.get(date, [])
+    events = [event.as_dict() for event in _events_cached(date)]
     
     result = {
         "date": date,
@@ -135,6 +254,48 @@ def get_calendar_events(
     return result
 
 
+def get_critical_meetings(
+    date: str,
+    user_id: str = "default",
+    tool_context: ToolContext = None,
+) -> dict:
+    """
+    Retrieve only the CRITICAL meetings for a specific date.
+    
+    Use this tool as a cheap first pass when assessing a disruption:
+    critical meetings (board meetings, client presentations) decide
+    which rebooking is acceptable. Use get_calendar_events for the
+    full schedule.
+    
+    Args:
+        date: Date in YYYY-MM-DD format (e.g., "2026-02-28")
+        user_id: User identifier (optional, for multi-user support)
+    
+    Returns:
+        dict: Critical meetings including:
+            - date: The requested date
+            - event_count: Number of critical events
+            - events: List of critical events with details
+    
+    Example:
+        >>> get_critical_meetings("2026-02-28")
+        {
+            "date": "2026-02-28",
+            "event_count": 1,
+            "events": [{"title": "Board Meeting with CEO", "priority": "critical", ...}]
+        }
+    """
+    logger.info("Getting critical meetings for %s", date)
+    
+    events = [event.as_dict() for event in _BY_PRIORITY.get((date, "critical"), ())]
+    
+    return {
+        "date": date,
+        "event_count": len(events),
+        "events": events,
+    }
+
+
 def find_meeting_conflicts(
     arrival_time: str,
     date: str,
@@ -172,9 +333,7 @@ def find_meeting_conflicts(
             "summary": "1 meeting at risk, 1 on track"
         }
     """
-    logger.info(f"Finding conflicts: arrival {arrival_time} on {date}")
-    
-    events = MOCK_CALENDAR.get(date, [])
+    logger.info("Finding conflicts: arrival %s on %s", arrival_time, date)
     
     # Parse arrival time
     try:
@@ -185,38 +344,33 @@ def find_meeting_conflicts(
     # Add 1 hour buffer for airport exit + travel
     available_hour = arrival_hour + 1
     available_min = arrival_min
+    available_total = available_hour * 60 + available_min
     
-    conflicts = []
-    at_risk = []
-    safe = []
-    
-    for event in events:
-        event_start_hour, event_start_min = map(int, event["start"].split(":"))
-        
-        # Calculate time difference
-        event_start_total = event_start_hour * 60 + event_start_min
-        available_total = available_hour * 60 + available_min
-        
-        if available_total > event_start_total:
-            # Will miss this meeting
-            conflicts.append({
-                **event,
-                "status": "will_miss",
-                "reason": f"Arrives at {arrival_time}, available from {available_hour:02d}:{available_min:02d}, meeting starts at {event['start']}",
-            })
-        elif available_total > event_start_total - 30:
-            # Cutting it close (less than 30 min buffer)
-            at_risk.append({
-                **event,
-                "status": "at_risk",
-                "reason": f"Only {event_start_total - available_total} minutes buffer",
-            })
-        else:
-            # Safe
-            safe.append({
-                **event,
-                "status": "on_track",
-            })
+    will_miss, tight, on_track = _conflicts_cached(date, available_total)
+    
+    conflicts = [
+        {
+            **event.as_dict(),
+            "status": "will_miss",
+            "reason": f"Arrives at {arrival_time}, available from {available_hour:02d}:{available_min:02d}, meeting starts at {event.start}",
+        }
+        for event in will_miss
+    ]
+    at_risk = [
+        {
+            **event.as_dict(),
+            "status": "at_risk",
+            "reason": f"Only {event.start_min - available_total} minutes buffer",
+        }
+        for event in tight
+    ]
+    safe = [
+        {
+            **event.as_dict(),
+            "status": "on_track",
+        }
+        for event in on_track
+    ]
     
     result = {
         "arrival_time": arrival_time,
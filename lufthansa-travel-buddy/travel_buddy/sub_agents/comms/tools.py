@@ -5,13 +5,140 @@ Tools for drafting professional notifications and reschedule requests.
 Uses templates for consistent, professional business communication.
 """
 
+import asyncio
+import atexit
+import functools
 import logging
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass, fields
+from email.message import EmailMessage
 from typing import Optional, List
 
 from google.adk.tools import ToolContext
 
+from ...config import (
+    SMTP_HOST,
+    SMTP_PORT,
+    SMTP_USERNAME,
+    SMTP_PASSWORD,
+    SMTP_SENDER,
+    SMTP_USE_TLS,
+)
+
 logger = logging.getLogger(__name__)
 
+# One SMTP connection, kept open across send_email calls so the TLS
+# handshake and AUTH are paid once rather than per message. It is only
+# touched from the single _smtp_executor thread, so it needs no lock.
+_smtp_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+_smtp_server: Optional[smtplib.SMTP] = None
+
+_DELAY_SUBJ_PREFIX = "Travel Update: Flight Delay - New Arrival "
+_RESCHED_SUBJ_PREFIX = "Meeting Reschedule Request: "
+
+
+@dataclass(frozen=True, slots=True)
+class EmailDraft:
+    """Email draft produced by the drafting tools."""
+    type: str
+    to: str
+    subject: str
+    body: str
+    status: str = "draft"
+    proposed_times: Optional[tuple] = None
+    original_time: Optional[str] = None
+    
+    def as_dict(self) -> dict:
+        """Return the draft in the dict shape returned by the tools."""
+        draft = {
+            "type": self.type,
+            "to": self.to,
+            "subject": self.subject,
+            "body": self.body,
+        }
+        if self.proposed_times is not None:
+            draft["proposed_times"] = list(self.proposed_times)
+            draft["original_time"] = self.original_time
+        draft["status"] = self.status
+        return draft
+
+
+# Column order of the rows stored in state["email_drafts"]
+_DRAFT_FIELDS = tuple(field.name for field in fields(EmailDraft))
+
+
+def _append_draft(tool_context: ToolContext, draft: EmailDraft) -> None:
+    """
+    Append a draft to the session's email_drafts list.
+    
+    Drafts are stored as rows in _DRAFT_FIELDS order rather than dicts, so
+    persisted session state does not repeat the key names per draft.
+    
+    ADK only persists state changes made by assignment (they become the
+    event's state delta), so the list is written back exactly once per
+    draft; an in-place append alone would be lost with persistent
+    session services.
+    """
+    state = tool_context.state
+    drafts = state.get("email_drafts")
+    if drafts is None:
+        drafts = []
+    drafts.append(astuple(draft))
+    state["email_drafts"] = drafts
+
+
+@functools.lru_cache(maxsize=256)
+def _delay_body(
+    recipient_name: str,
+    delay_info: str,
+    new_arrival: str,
+    meeting_impact: Optional[str],
+    sender_name: str,
+) -> str:
+    """Render a delay notification body; memoized for repeated broadcasts."""
+    meeting_line = f"\n\n**Impact on Our Meeting:** {meeting_impact}" if meeting_impact else ""
+    
+    return (
+        f"Dear {recipient_name},\n"
+        "\n"
+        "I wanted to inform you that my flight has experienced a delay. Here are the updated details:\n"
+        "\n"
+        f"**Delay:** {delay_info}\n"
+        f"**New Arrival:** {new_arrival}{meeting_line}\n"
+        "\n"
+        "I will keep you updated if there are any further changes. Please let me know if we need to adjust our plans.\n"
+        "\n"
+        "Best regards,\n"
+        f"{sender_name}"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _reschedule_body(
+    recipient_name: str,
+    reason: str,
+    original_time: str,
+    meeting_ref: str,
+    times_formatted: str,
+    sender_name: str,
+) -> str:
+    """Render a reschedule request body; memoized for repeated broadcasts."""
+    return (
+        f"Dear {recipient_name},\n"
+        "\n"
+        f"Due to {reason}, I need to request a reschedule of our meeting originally planned for {original_time}{meeting_ref}.\n"
+        "\n"
+        "Would any of the following alternative times work for you?\n"
+        "\n"
+        f"{times_formatted}\n"
+        "\n"
+        "I apologize for any inconvenience and appreciate your flexibility.\n"
+        "\n"
+        "Best regards,\n"
+        f"{sender_name}"
+    )
+
 
 def draft_delay_notification(
     recipient_email: str,
@@ -54,51 +181,19 @@ def draft_delay_notification(
         ...     meeting_impact="I will arrive 30 minutes before our board meeting"
         ... )
     """
-    logger.info(f"Drafting delay notification to {recipient_email}")
-    
-    subject = f"Travel Update: Flight Delay - New Arrival {new_arrival}"
-    
-    # Build email body
-    body_parts = [
-        f"Dear {recipient_name},",
-        "",
-        "I wanted to inform you that my flight has experienced a delay. Here are the updated details:",
-        "",
-        f"**Delay:** {delay_info}",
-        f"**New Arrival:** {new_arrival}",
-    ]
-    
-    if meeting_impact:
-        body_parts.extend([
-            "",
-            f"**Impact on Our Meeting:** {meeting_impact}",
-        ])
-    
-    body_parts.extend([
-        "",
-        "I will keep you updated if there are any further changes. Please let me know if we need to adjust our plans.",
-        "",
-        "Best regards,",
-        sender_name,
-    ])
-    
-    body = "\n".join(body_parts)
-    
-    result = {
-        "type": "email",
-        "to": recipient_email,
-        "subject": subject,
-        "body": body,
-        "status": "draft",
-    }
+    logger.info("Drafting delay notification to %s", recipient_email)
+    
+    subject = _DELAY_SUBJ_PREFIX + new_arrival
+    
+    body = _delay_body(recipient_name, delay_info, new_arrival, meeting_impact, sender_name)
+    
+    draft = EmailDraft(type="email", to=recipient_email, subject=subject, body=body)
     
     # Store in context
     if tool_context:
-        drafts = tool_context.state.get("email_drafts", [])
-        drafts.append(result)
-        tool_context.state["email_drafts"] = drafts
+        _append_draft(tool_context, draft)
     
-    return result
+    return draft.as_dict()
 
 
 def draft_reschedule_request(
@@ -138,49 +233,91 @@ def draft_reschedule_request(
         ...     reason="flight delay from Frankfurt"
         ... )
     """
-    logger.info(f"Drafting reschedule request to {recipient_email}")
+    logger.info("Drafting reschedule request to %s", recipient_email)
     
     meeting_ref = f" ({meeting_title})" if meeting_title else ""
-    subject = f"Meeting Reschedule Request: {original_time}{meeting_ref}"
+    subject = _RESCHED_SUBJ_PREFIX + original_time + meeting_ref
     
     # Format proposed times as a list
-    times_formatted = "\n".join([f"  • {t}" for t in proposed_times])
-    
-    body_parts = [
-        f"Dear {recipient_name},",
-        "",
-        f"Due to {reason}, I need to request a reschedule of our meeting originally planned for {original_time}{meeting_ref}.",
-        "",
-        "Would any of the following alternative times work for you?",
-        "",
-        times_formatted,
-        "",
-        "I apologize for any inconvenience and appreciate your flexibility.",
-        "",
-        "Best regards,",
-        sender_name,
-    ]
-    
-    body = "\n".join(body_parts)
-    
-    result = {
-        "type": "email",
-        "to": recipient_email,
-        "subject": subject,
-        "body": body,
-        "proposed_times": proposed_times,
-        "original_time": original_time,
-        "status": "draft",
-    }
+    times_formatted = "\n".join(f"  • {t}" for t in proposed_times)
+    
+    body = _reschedule_body(
+        recipient_name, reason, original_time, meeting_ref, times_formatted, sender_name
+    )
+    
+    draft = EmailDraft(
+        type="email",
+        to=recipient_email,
+        subject=subject,
+        body=body,
+        proposed_times=tuple(proposed_times),
+        original_time=original_time,
+    )
     
     # Store in context
     if tool_context:
-        drafts = tool_context.state.get("email_drafts", [])
-        drafts.append(result)
-        tool_context.state["email_drafts"] = drafts
+        _append_draft(tool_context, draft)
+    
+    return draft.as_dict()
+
+
+def _smtp_connect() -> smtplib.SMTP:
+    """Open and authenticate a new SMTP connection."""
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+    if SMTP_USE_TLS:
+        server.starttls()
+    if SMTP_USERNAME:
+        server.login(SMTP_USERNAME, SMTP_PASSWORD)
+    return server
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _discard_smtp() -> None:
+    global _smtp_server
+    if _smtp_server is not None:
+        _close_smtp(_smtp_server)
+        _smtp_server = None
+
+
+# atexit hooks run after the interpreter has joined the executor thread,
+# so nothing else is using the connection by then
+atexit.register(_discard_smtp)
+
+# Errors meaning the connection itself is gone. Others (e.g. a refused
+# recipient) leave it usable and must not trigger a resend.
+_SMTP_DROPPED = (smtplib.SMTPServerDisconnected, ConnectionError)
+
+
+def _smtp_send(msg: EmailMessage) -> None:
+    """
+    Send a message on the shared connection (blocking, on _smtp_executor).
     
-    return result
-def send_email(
+    A connection that went stale while idle shows up as a failed send;
+    it is then replaced and the message sent once more, rather than
+    probing the server with NOOP before every message.
+    """
+    global _smtp_server
+    if _smtp_server is not None:
+        try:
+            _smtp_server.send_message(msg)
+            return
+        except _SMTP_DROPPED:
+            _discard_smtp()
+    _smtp_server = _smtp_connect()
+    try:
+        _smtp_server.send_message(msg)
+    except _SMTP_DROPPED:
+        _discard_smtp()
+        raise
+
+
+async def send_email(
     to_email: str,
     subject: str,
     body: str,
@@ -196,17 +333,35 @@ def send_email(
     Returns:
         Confirmation of email sent
     """
-    # For demo - just simulate sending
-    # In production, integrate with Gmail API or SMTP
-    
-    print(f"\n📧 SENDING EMAIL:")
-    print(f"   To: {to_email}")
-    print(f"   Subject: {subject}")
-    print(f"   Body: {body[:100]}...")
+    if not SMTP_HOST:
+        # For demo - just simulate sending
+        print(f"\n📧 SENDING EMAIL:")
+        print(f"   To: {to_email}")
+        print(f"   Subject: {subject}")
+        print(f"   Body: {body[:100]}...")
+    elif not SMTP_SENDER:
+        # SMTP_SENDER falls back to SMTP_USERNAME, which may be unset too
+        logger.error("Cannot send email to %s: set SMTP_SENDER or SMTP_USERNAME", to_email)
+        return {"status": "failed", "to": to_email, "error": "Failed to send email: no sender address configured"}
+    else:
+        msg = EmailMessage()
+        msg["From"] = SMTP_SENDER
+        msg["To"] = to_email
+        msg["Subject"] = subject
+        msg.set_content(body)
+        
+        try:
+            # SMTP is blocking; run it on the SMTP thread so the event
+            # loop keeps serving concurrent tool calls and streaming
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_smtp_executor, _smtp_send, msg)
+        except (smtplib.SMTPException, OSError) as e:
+            logger.error("Failed to send email to %s: %s", to_email, e)
+            return {"status": "failed", "to": to_email, "error": f"Failed to send email: {str(e)}"}
     
     return {
         "status": "sent",
         "to": to_email,
         "subject": subject,
         "message": f"Email successfully sent to {to_email}"
-    }
\ No newline at end of file
+    }
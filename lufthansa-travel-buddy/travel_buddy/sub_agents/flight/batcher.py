@@ -0,0 +1,104 @@
+"""
+Flight Lookup Batcher
+
+Coalesces flight lookups issued within a short window, so parallel
+tool calls (e.g. every leg of a connection) are dispatched together
+and identical lookups share a single Lufthansa API round-trip.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """
+    Micro-batcher for async lookups.
+    
+    The first `submit` opens a window of `window_ms`; every key submitted
+    before it closes joins the same batch. Identical keys share one
+    future. The batch is handed to `dispatch` in a single call, or
+    earlier once it holds `max_batch` distinct keys.
+    
+    Usage:
+        batcher = AsyncBatcher(dispatch=fetch_many)
+        result = await batcher.submit(("LH400", "2026-02-28"))
+    """
+    
+    def __init__(
+        self,
+        dispatch: Callable[[List[Hashable]], Awaitable[List[Any]]],
+        window_ms: float = 10,
+        max_batch: int = 32,
+    ):
+        """
+        Args:
+            dispatch: Coroutine taking a list of keys and returning one
+                      result per key, in order. A result that is an
+                      exception is raised to the callers of that key.
+            window_ms: Coalescing window in milliseconds
+            max_batch: Maximum distinct keys per dispatch
+        """
+        self._dispatch = dispatch
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+    
+    async def submit(self, key: Hashable) -> Any:
+        """Queue a lookup for `key` and wait for its result."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self._window, self._flush)
+        # Shield the shared future so one cancelled caller does not
+        # cancel the lookup for everyone else waiting on the same key
+        return await asyncio.shield(future)
+    
+    def _flush(self) -> None:
+        """Hand all pending keys to the dispatcher."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        """Dispatch one batch and fan results out to the waiting futures."""
+        keys = list(batch)
+        logger.debug("Dispatching batch of %d lookup(s)", len(keys))
+        try:
+            results = await self._dispatch(keys)
+        except Exception as e:
+            results = [e] * len(keys)
+        
+        # A short result list would leave the trailing futures unresolved
+        # and their callers waiting forever; fail those keys instead
+        results = list(results)
+        if len(results) < len(keys):
+            logger.error("Batch dispatch returned %d result(s) for %d key(s)", len(results), len(keys))
+            missing = RuntimeError(
+                f"Batch dispatch returned {len(results)} result(s) for {len(keys)} key(s)"
+            )
+            results += [missing] * (len(keys) - len(results))
+        
+        for key, result in zip(keys, results):
+            future = batch[key]
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -5,19 +5,109 @@ Tools for checking flight status, finding alternatives, and getting details.
 Uses the official Lufthansa Open API for authentic data.
 """
 
+import copy
+import functools
+import heapq
 import logging
+import re
+import time
 from typing import Optional
 from datetime import datetime, timedelta
 
 from google.adk.tools import ToolContext
 
-from ...tools.lufthansa_api import lufthansa_client
+from ...tools.lufthansa_api import get_lufthansa_client
 from ...config import LUFTHANSA_GROUP_AIRLINES
+from ...shared_libraries import TTLCache
+from .batcher import AsyncBatcher
 
 logger = logging.getLogger(__name__)
 
+# str.startswith accepts a tuple, checking every prefix in one call
+_LH_PREFIXES = tuple(LUFTHANSA_GROUP_AIRLINES)
 
-def check_flight_status(
+# Optional 2-character airline designator (e.g. "LH", "4U") followed by
+# the flight number; matches "LH456", "lh 456", "456" and "0456"
+_FLIGHT_RE = re.compile(r"^\s*([A-Z]{2}|[A-Z]\d|\d[A-Z])?\s*0*(\d{1,4})\s*$", re.I)
+
+
+@functools.lru_cache(maxsize=1)
+def _local_minute(epoch_minute: int) -> str:
+    """Local time as YYYY-MM-DDTHH:MM; formatted once per minute."""
+    return datetime.now().strftime("%Y-%m-%dT%H:%M")
+
+
+def _now() -> str:
+    """Current local time in YYYY-MM-DDTHH:MM format."""
+    return _local_minute(int(time.time()) // 60)
+
+
+def _today() -> str:
+    """Current local date in YYYY-MM-DD format."""
+    return _now()[:10]
+
+
+def _normalize_flight(flight_number: str, date: Optional[str]) -> tuple[str, str]:
+    """
+    Canonicalize a flight number and date for API lookups.
+    
+    Adds the LH prefix to bare numbers, strips spaces and leading zeros,
+    and defaults the date to today.
+    
+    Returns:
+        tuple: (flight_number, date), e.g. ("LH456", "2026-02-28")
+    """
+    m = _FLIGHT_RE.match(flight_number)
+    if m:
+        flight_number = f"{(m.group(1) or 'LH').upper()}{m.group(2)}"
+    else:
+        flight_number = flight_number.upper().replace(" ", "")
+    return flight_number, date or _today()
+
+
+async def _dispatch_flight_status(keys: list) -> list:
+    """
+    Fetch status for a batch of (flight_number, date) keys.
+    
+    The Lufthansa API has no multi-flight status endpoint, so distinct
+    keys are requested concurrently; duplicates were already merged
+    by the batcher.
+    """
+    return await get_lufthansa_client().get_flight_statuses(keys)
+
+
+_status_batcher = AsyncBatcher(_dispatch_flight_status, window_ms=10, max_batch=32)
+
+# Agents re-ask about the same route/airport within seconds (follow-up
+# questions); successful lookups are reused for 60s. Single-flight status
+# is cached by the Lufthansa client itself.
+_route_cache = TTLCache(maxsize=512, ttl=60)    # (origin, destination, date)
+_board_cache = TTLCache(maxsize=512, ttl=60)    # (kind, airport, from_time, limit)
+
+# Route and board keys whose upstream call just raised. Repeats within the
+# window fail fast instead of spending another request timeout on an API
+# that is known to be failing for them.
+_failure_cache = TTLCache(maxsize=512, ttl=15)
+
+# Per-session cache of finished find_alternative_flights results, kept in
+# tool_context.state so rephrased follow-ups skip the work entirely. Each
+# result is its own state key, so a call's state delta carries just that
+# entry plus the small key index used for LRU trimming, never the whole
+# cache. Timestamps are wall-clock (time.time, not time.monotonic) so
+# entries stay valid across restarts and processes when sessions live in
+# Redis; keys are strings so the state stays JSON-safe.
+_ALT_CACHE_PREFIX = "_alt_cache:"
+_ALT_CACHE_KEYS = "_alt_cache_keys"
+_ALT_CACHE_TTL = 120
+_ALT_CACHE_MAX = 32
+
+
+async def _fetch_status(flight_number: str, date: str) -> dict:
+    """Get flight status via the batcher (the client caches responses)."""
+    return await _status_batcher.submit((flight_number, date))
+
+
+async def check_flight_status(
     flight_number: str = None,
     date: str = None,
     booking_id: str = None,
@@ -56,11 +146,7 @@ def check_flight_status(
             "departure": {"airport": "HAM", "scheduled": "10:00", ...}
         }
     """
-    logger.info(f"Checking flight status: {flight_number} on {date}")
-    
-    # Default to today if no date provided
-    if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
+    logger.info("Checking flight status: %s on %s", flight_number, date)
     
     # Handle booking ID (would need Lufthansa booking API)
     if booking_id and not flight_number:
@@ -72,30 +158,27 @@ def check_flight_status(
     if not flight_number:
         return {"error": "Please provide a flight_number (e.g., 'LH456')"}
     
-    # Normalize flight number
-    flight_number = flight_number.upper().replace(" ", "")
-    
-    # Add LH prefix if just a number
-    if flight_number.isdigit():
-        flight_number = f"LH{flight_number}"
+    flight_number, date = _normalize_flight(flight_number, date)
     
     try:
-        result = lufthansa_client.get_flight_status(flight_number, date)
+        result = await _fetch_status(flight_number, date)
         
-        # Store in context for other tools to use
+        # Store in context for other tools to use; the normalized number
+        # and date travel inside current_flight rather than as extra keys.
+        # Built as a new dict: the batcher hands the same result object to
+        # every coalesced caller.
         if tool_context and "error" not in result:
+            result = {"flight_number": flight_number, "flight_date": date, **result}
             tool_context.state["current_flight"] = result
-            tool_context.state["flight_number"] = flight_number
-            tool_context.state["flight_date"] = date
         
         return result
         
     except Exception as e:
-        logger.error(f"Error fetching flight status: {e}")
+        logger.error("Error fetching flight status: %s", e)
         return {"error": f"Failed to fetch flight status: {str(e)}"}
 
 
-def find_alternative_flights(
+async def find_alternative_flights(
     origin: str,
     destination: str,
     date: str = None,
@@ -132,62 +215,94 @@ def find_alternative_flights(
             "recommendation": "LH2042 - earliest arrival"
         }
     """
-    logger.info(f"Finding alternatives: {origin} → {destination} on {date}")
+    logger.info("Finding alternatives: %s → %s on %s", origin, destination, date)
     
     # Default to today
     if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
+        date = _today()
     
     # Normalize airport codes
     origin = origin.upper().strip()
     destination = destination.upper().strip()
     
+    alt_key = f"{origin}|{destination}|{date}|{direct_only}|{preferred_class}"
+    if tool_context:
+        hit = tool_context.state.get(_ALT_CACHE_PREFIX + alt_key)
+        if hit and time.time() - hit[0] < _ALT_CACHE_TTL:
+            tool_context.state["alternatives"] = hit[1]
+            return hit[1]
+    
+    route_key = (origin, destination, date)
+    if _failure_cache.get(route_key):
+        return {"error": "Failed to find alternatives: upstream lookup failed moments ago, try again shortly", "cached": True}
+    
     try:
         # Get flights on the route
-        result = lufthansa_client.get_flight_status_by_route(origin, destination, date)
+        result = _route_cache.get(route_key)
+        if result is None:
+            result = await get_lufthansa_client().get_flight_status_by_route(
+                origin, destination, date, airline_codes=_LH_PREFIXES
+            )
+            if "error" not in result:
+                _route_cache.set(route_key, result)
         
         flights = result.get("flights", [])
+        # The client already dropped non-Lufthansa Group carriers when it
+        # marks the result filtered; only re-check otherwise
+        prefixes = "" if result.get("filtered") else _LH_PREFIXES
         
-        # Filter for Lufthansa Group if needed
-        lh_flights = [
-            f for f in flights 
-            if any(f.get("flight", "").startswith(code) for code in LUFTHANSA_GROUP_AIRLINES)
-        ]
+        # Single pass: filter Lufthansa Group, collect sort keys, and track
+        # the earliest non-cancelled flight for the recommendation
+        candidates = []
+        best = best_dep = None
+        for seq, flight in enumerate(flights):
+            code = flight.get("flight", "")
+            if not code.startswith(prefixes):
+                continue
+            dep = flight.get("departure_time", "")
+            candidates.append((dep, seq, flight))
+            if flight.get("status") != "CD" and (best is None or dep < best_dep):
+                best, best_dep = flight, dep
         
-        # Sort by departure time
-        lh_flights.sort(key=lambda f: f.get("departure_time", ""))
+        # Earliest five by departure time (seq keeps ties in API order)
+        top = [flight for _, _, flight in heapq.nsmallest(5, candidates)]
         
-        # Add recommendation
         recommendation = None
-        if lh_flights:
-            # Find first non-cancelled flight
-            for flight in lh_flights:
-                if flight.get("status") != "CD":  # Not cancelled
-                    recommendation = f"{flight['flight']} - departs {flight.get('departure_time', 'N/A')}"
-                    break
+        if best is not None:
+            # "N/A" only when the field is missing; an empty time stays empty
+            recommendation = f"{best.get('flight', '')} - departs {best.get('departure_time', 'N/A')}"
         
         result = {
             "origin": origin,
             "destination": destination,
             "date": date,
-            "flights": lh_flights[:5],  # Top 5
-            "count": len(lh_flights),
+            "flights": copy.deepcopy(top),  # Top 5, detached from _route_cache
+            "count": len(candidates),
             "recommendation": recommendation,
             "preferred_class": preferred_class,
         }
         
         # Store in context
         if tool_context:
-            tool_context.state["alternatives"] = result
+            state = tool_context.state
+            keys = [k for k in state.get(_ALT_CACHE_KEYS) or () if k != alt_key]
+            keys.append(alt_key)
+            # ADK state has no delete; evicted entries are cleared to None
+            for evicted in keys[:-_ALT_CACHE_MAX]:
+                state[_ALT_CACHE_PREFIX + evicted] = None
+            state[_ALT_CACHE_KEYS] = keys[-_ALT_CACHE_MAX:]
+            state[_ALT_CACHE_PREFIX + alt_key] = [time.time(), result]
+            state["alternatives"] = result
         
         return result
         
     except Exception as e:
-        logger.error(f"Error finding alternatives: {e}")
+        _failure_cache.set(route_key, True)
+        logger.error("Error finding alternatives: %s", e)
         return {"error": f"Failed to find alternatives: {str(e)}"}
 
 
-def get_flight_details(
+async def get_flight_details(
     flight_number: str,
     date: str = None,
     tool_context: ToolContext = None,
@@ -209,24 +324,18 @@ def get_flight_details(
             - Current flight status
             - Scheduled vs actual times
     """
-    logger.info(f"Getting flight details: {flight_number}")
+    logger.info("Getting flight details: %s", flight_number)
     
-    if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
-    
-    # Normalize flight number
-    flight_number = flight_number.upper().replace(" ", "")
-    if flight_number.isdigit():
-        flight_number = f"LH{flight_number}"
+    flight_number, date = _normalize_flight(flight_number, date)
     
     try:
-        return lufthansa_client.get_flight_status(flight_number, date)
+        return await _fetch_status(flight_number, date)
     except Exception as e:
-        logger.error(f"Error getting flight details: {e}")
+        logger.error("Error getting flight details: %s", e)
         return {"error": f"Failed to get flight details: {str(e)}"}
 
 
-def get_airport_departures(
+async def get_airport_departures(
     airport: str,
     from_time: str = None,
     limit: int = 10,
@@ -246,21 +355,31 @@ def get_airport_departures(
     Returns:
         dict: List of departing flights with status
     """
-    logger.info(f"Getting departures from {airport}")
+    logger.info("Getting departures from %s", airport)
     
     airport = airport.upper().strip()
     
     if not from_time:
-        from_time = datetime.now().strftime("%Y-%m-%dT%H:%M")
+        from_time = _now()
+    
+    key = ("departures", airport, from_time, limit)
+    if _failure_cache.get(key):
+        return {"error": "Failed to get departures: upstream lookup failed moments ago, try again shortly", "cached": True}
     
     try:
-        return lufthansa_client.get_departures(airport, from_time, limit)
+        result = _board_cache.get(key)
+        if result is None:
+            result = await get_lufthansa_client().get_departures(airport, from_time, limit)
+            _board_cache.set(key, result)
+        # Every caller gets its own copy of the cached board
+        return copy.deepcopy(result)
     except Exception as e:
-        logger.error(f"Error getting departures: {e}")
+        _failure_cache.set(key, True)
+        logger.error("Error getting departures: %s", e)
         return {"error": f"Failed to get departures: {str(e)}"}
 
 
-def get_airport_arrivals(
+async def get_airport_arrivals(
     airport: str,
     from_time: str = None,
     limit: int = 10,
@@ -280,15 +399,25 @@ def get_airport_arrivals(
     Returns:
         dict: List of arriving flights with status
     """
-    logger.info(f"Getting arrivals at {airport}")
+    logger.info("Getting arrivals at %s", airport)
     
     airport = airport.upper().strip()
     
     if not from_time:
-        from_time = datetime.now().strftime("%Y-%m-%dT%H:%M")
+        from_time = _now()
+    
+    key = ("arrivals", airport, from_time, limit)
+    if _failure_cache.get(key):
+        return {"error": "Failed to get arrivals: upstream lookup failed moments ago, try again shortly", "cached": True}
     
     try:
-        return lufthansa_client.get_arrivals(airport, from_time, limit)
+        result = _board_cache.get(key)
+        if result is None:
+            result = await get_lufthansa_client().get_arrivals(airport, from_time, limit)
+            _board_cache.set(key, result)
+        # Every caller gets its own copy of the cached board
+        return copy.deepcopy(result)
     except Exception as e:
-        logger.error(f"Error getting arrivals: {e}")
+        _failure_cache.set(key, True)
+        logger.error("Error getting arrivals: %s", e)
         return {"error": f"Failed to get arrivals: {str(e)}"}
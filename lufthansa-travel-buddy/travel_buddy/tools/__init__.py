@@ -1,5 +1,5 @@
 """Shared tools across agents."""
 
-from .lufthansa_api import lufthansa_client, LufthansaAPIClient
+from .lufthansa_api import get_lufthansa_client, LufthansaAPIClient
 
-__all__ = ["lufthansa_client", "LufthansaAPIClient"]
+__all__ = ["get_lufthansa_client", "LufthansaAPIClient"]
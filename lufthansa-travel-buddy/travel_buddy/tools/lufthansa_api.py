@@ -7,24 +7,139 @@ API Documentation: https://developer.lufthansa.com/docs
 Authentication: OAuth 2.0 Client Credentials flow
 """
 
+import asyncio
+import atexit
+import copy
+import functools
 import logging
+import os
 import time
-from typing import Optional, Dict, Any
-import requests
+import uuid
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+
+import aiohttp
+import orjson
 
 from ..config import (
     LUFTHANSA_CLIENT_ID,
     LUFTHANSA_CLIENT_SECRET,
     LUFTHANSA_API_BASE_URL,
     LUFTHANSA_AUTH_URL,
+    LH_MAX_PARALLEL,
+    LH_TOKEN_CACHE_PATH,
+    REDIS_URL,
 )
+from ..shared_libraries import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Transient gateway errors and dropped keep-alive connections are retried
+# with exponential backoff (0.2s, 0.4s) before surfacing to the caller
+_MAX_RETRIES = 2
+_RETRY_BACKOFF = 0.2
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# The background refresher renews the token this many seconds before it
+# expires, retrying every _TOKEN_RETRY_DELAY seconds while OAuth fails
+_TOKEN_REFRESH_AHEAD = 300
+_TOKEN_RETRY_DELAY = 30
+
+# Inline safety margin before expiry. Kept small: the background refresher
+# renews early and a 401 triggers one refresh-and-retry in _make_request.
+_TOKEN_EXPIRY_MARGIN = 5
+
+# With REDIS_URL set, replicas share one token: the refresher holds a
+# short SET NX lock while the others wait up to _SHARED_TOKEN_WAIT seconds
+# for it to publish the new token
+_TOKEN_LOCK_TTL = 30
+_SHARED_TOKEN_WAIT = 5.0
+_SHARED_TOKEN_POLL = 0.2
+
+# _acquire_refresh_lock result when Redis is not configured or unreachable:
+# no other process can be refreshing, so the token is fetched directly
+_LOCK_UNAVAILABLE = ""
+
+# Headers common to every API request; only Authorization varies. Large
+# route/board JSON compresses well and aiohttp decompresses transparently.
+_BASE_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# Delete the refresh lock only if this client still owns it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Response cache lifetimes: reference data (airports, airlines, aircraft)
+# is effectively static; flight status and schedules are volatile
+_REFERENCE_TTL = 24 * 3600
+_VOLATILE_TTL = 60
+
+# Key paths into the Lufthansa flight status JSON, resolved once here
+# rather than as nested .get() chains in every parse
+_FLIGHTS_PATH = ("FlightStatusResource", "Flights", "Flight")
+_AIRLINE_PATH = ("MarketingCarrier", "AirlineID")
+_FLIGHT_NUMBER_PATH = ("MarketingCarrier", "FlightNumber")
+_STATUS_CODE_PATH = ("FlightStatus", "Code")
+
+# Fields of a Departure/Arrival block
+_ENDPOINT_FIELDS = (
+    ("airport", ("AirportCode",)),
+    ("terminal", ("Terminal", "Name")),
+    ("gate", ("Terminal", "Gate")),
+    ("scheduled", ("ScheduledTimeLocal", "DateTime")),
+    ("estimated", ("EstimatedTimeLocal", "DateTime")),
+    ("actual", ("ActualTimeLocal", "DateTime")),
+)
+
+_AIRCRAFT_FIELDS = (
+    ("code", ("Equipment", "AircraftCode")),
+    ("registration", ("Equipment", "AircraftRegistration")),
+)
+
+# Fields of a route flight besides the combined flight code
+_ROUTE_FLIGHT_FIELDS = (
+    ("status", _STATUS_CODE_PATH),
+    ("departure_time", ("Departure", "ScheduledTimeLocal", "DateTime")),
+    ("arrival_time", ("Arrival", "ScheduledTimeLocal", "DateTime")),
+    ("origin", ("Departure", "AirportCode")),
+    ("destination", ("Arrival", "AirportCode")),
+)
+
+# Lufthansa flight status codes
+_STATUS_CODES = {
+    "CD": "Cancelled",
+    "DP": "Departed",
+    "LD": "Landed",
+    "RT": "Rerouted",
+    "DV": "Diverted",
+    "HD": "On Hold",
+    "FE": "Flight Early",
+    "NI": "Next Information",
+    "OT": "On Time",
+    "DL": "Delayed",
+    "NO": "No Status",
+}
+
+
+def _dig(data: Any, path: tuple, default: Any = "") -> Any:
+    """Follow `path` through nested dicts, returning `default` on any miss."""
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
 
 class LufthansaAPIClient:
     """
-    Client for Lufthansa Open API.
+    Async client for Lufthansa Open API.
     
     Handles OAuth authentication and provides methods for:
     - Flight Status
@@ -32,8 +147,8 @@ class LufthansaAPIClient:
     - Reference Data (airports, airlines, aircraft)
     
     Usage:
-        client = LufthansaAPIClient()
-        status = client.get_flight_status("LH456", "2026-02-28")
+        async with LufthansaAPIClient() as client:
+            status = await client.get_flight_status("LH456", "2026-02-28")
     """
     
     def __init__(self):
@@ -42,52 +157,354 @@ class LufthansaAPIClient:
         self.base_url = LUFTHANSA_API_BASE_URL
         self.auth_url = LUFTHANSA_AUTH_URL
         
-        # Token cache
+        # Token cache, seeded from disk so restarts reuse a still-valid token
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0
+        self._auth_header = ""
+        self._rejected_token: Optional[str] = None
+        self._token_path = LH_TOKEN_CACHE_PATH
+        self._load_cached_token()
+        
+        # Optional token sharing between processes/replicas through Redis
+        self._redis = None
+        self._redis_errors: tuple = ()
+        self._token_key = f"lufthansa:token:{self.client_id}"
+        self._token_lock_key = f"{self._token_key}:lock"
+        
+        # One pooled aiohttp session for OAuth and API calls, created on
+        # first use. The connector limit bounds in-flight API calls across
+        # all concurrent tool calls (rate limit guard).
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._refresher: Optional[asyncio.Task] = None
+        
+        # Successful GET responses, plus the in-flight request per key so
+        # concurrent callers share one upstream call instead of stampeding
+        self._reference_cache = TTLCache(maxsize=4096, ttl=_REFERENCE_TTL)
+        self._volatile_cache = TTLCache(maxsize=4096, ttl=_VOLATILE_TTL)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+    
+    async def __aenter__(self) -> "LufthansaAPIClient":
+        await self._ensure_session()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session, creating it on first use.
+        
+        aiohttp sessions and asyncio locks are bound to the event loop
+        they were created on, so they are rebuilt if the client is
+        later used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # Swap synchronously so concurrent callers never see a half-built
+            # client, then close the replaced clients
+            old_loop = self._session_loop
+            closing = self._close_clients(self._session, self._redis, self._refresher)
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15),
+                connector=aiohttp.TCPConnector(
+                    limit=LH_MAX_PARALLEL,
+                    limit_per_host=LH_MAX_PARALLEL,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300,
+                ),
+            )
+            self._session_loop = loop
+            self._token_lock = asyncio.Lock()
+            self._refresher = None
+            self._inflight.clear()
+            self._redis = self._connect_redis()
+            await self._release_clients(closing, old_loop)
+        return self._session
+    
+    def _connect_redis(self):
+        """Return a Redis client for token sharing, or None if not configured."""
+        if not REDIS_URL:
+            return None
+        try:
+            import redis.asyncio as aioredis
+            from redis.exceptions import RedisError
+        except ImportError:
+            logger.warning("REDIS_URL is set but the 'redis' package is missing; token sharing disabled")
+            return None
+        self._redis_errors = (RedisError, OSError)
+        return aioredis.Redis.from_url(REDIS_URL)
+    
+    async def close(self) -> None:
+        """Stop the token refresher and close the pooled HTTP and Redis clients."""
+        session, redis, refresher = self._session, self._redis, self._refresher
+        self._session = self._redis = self._refresher = None
+        await self._close_clients(session, redis, refresher)
+    
+    @staticmethod
+    async def _close_clients(session, redis, refresher) -> None:
+        if refresher is not None:
+            refresher.cancel()
+        if session is not None and not session.closed:
+            await session.close()
+        if redis is not None:
+            await redis.aclose()
+    
+    async def _release_clients(self, closing, old_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Run `closing` for clients replaced by _ensure_session.
+        
+        Clients still served by another running loop are closed there;
+        those of a finished loop are closed best-effort from this one, as
+        their transports can no longer be driven.
+        """
+        if old_loop not in (None, asyncio.get_running_loop()) and old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(closing, old_loop)
+            return
+        try:
+            await closing
+        except (RuntimeError, *self._redis_errors) as e:
+            logger.debug("Could not cleanly close clients of a finished event loop: %s", e)
+    
+    def _close_at_exit(self) -> None:
+        """atexit hook: close the clients, on the loop that owns them if it is alive."""
+        loop = self._session_loop
+        if self._session is None or loop is None:
+            return
+        try:
+            if loop.is_running():
+                # e.g. the app's background loop thread, still up during atexit
+                asyncio.run_coroutine_threadsafe(self.close(), loop).result(timeout=5)
+            elif loop.is_closed():
+                # e.g. after asyncio.run(); best-effort, like _release_clients
+                asyncio.run(self.close())
+            else:
+                loop.run_until_complete(self.close())
+        except Exception as e:
+            logger.debug("Could not close Lufthansa API client at exit: %s", e)
     
-    def _get_access_token(self) -> str:
+    async def _get_access_token(self) -> str:
         """
         Get OAuth access token, refreshing if expired.
         
+        The background refresher normally renews the token well before
+        expiry; refreshing here is the fallback for the first call and
+        for clock skew.
+        
         Returns:
             str: Valid access token
         """
-        # Check if token is still valid (with 60s buffer)
-        if self._access_token and time.time() < self._token_expires_at - 60:
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._token_refresher_loop())
+        
+        if self._token_valid(_TOKEN_EXPIRY_MARGIN):
             return self._access_token
         
+        return await self._refresh_token(min_ttl=_TOKEN_EXPIRY_MARGIN)
+    
+    def _reject_token(self, token: str) -> None:
+        """Forget a token the API refused, so it isn't re-adopted from disk or Redis."""
+        self._rejected_token = token
+        if self._access_token == token:
+            self._set_token(None, 0)
+    
+    def _set_token(self, token: Optional[str], expires_at: float) -> None:
+        """Store the token and the Authorization header value derived from it."""
+        self._access_token = token
+        self._token_expires_at = expires_at
+        self._auth_header = f"Bearer {token}" if token else ""
+    
+    def _token_valid(self, min_ttl: float) -> bool:
+        return bool(self._access_token) and time.time() < self._token_expires_at - min_ttl
+    
+    async def _refresh_token(self, min_ttl: float) -> str:
+        """Fetch a new token unless the current one is valid for `min_ttl` more seconds."""
+        session = await self._ensure_session()
+        async with self._token_lock:
+            # Another request, or another process, may have refreshed
+            # while we waited
+            if self._token_valid(min_ttl):
+                return self._access_token
+            self._load_cached_token()
+            if self._token_valid(min_ttl) or await self._load_shared_token(min_ttl):
+                return self._access_token
+            
+            lock_id = await self._acquire_refresh_lock()
+            if lock_id is None and await self._wait_for_shared_token(min_ttl):
+                return self._access_token
+            try:
+                await self._fetch_token(session)
+            finally:
+                if lock_id:
+                    await self._release_refresh_lock(lock_id)
+            return self._access_token
+    
+    async def _fetch_token(self, session: aiohttp.ClientSession) -> None:
+        """Run the OAuth client-credentials grant and store the result."""
         logger.info("Refreshing Lufthansa API access token")
         
         try:
-            response = requests.post(
+            async with session.post(
                 self.auth_url,
                 data={
                     "client_id": self.client_id,
                     "client_secret": self.client_secret,
                     "grant_type": "client_credentials",
                 },
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                timeout=10,
-            )
-            response.raise_for_status()
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                response.raise_for_status()
+                token_data = orjson.loads(await response.read())
             
-            token_data = response.json()
-            self._access_token = token_data["access_token"]
             # Token typically expires in 36000 seconds (10 hours)
             expires_in = token_data.get("expires_in", 36000)
-            self._token_expires_at = time.time() + expires_in
+            self._set_token(token_data["access_token"], time.time() + expires_in)
+            self._save_cached_token()
+            await self._publish_shared_token(expires_in)
             
-            logger.info(f"Got new access token, expires in {expires_in}s")
-            return self._access_token
+            logger.info("Got new access token, expires in %ss", expires_in)
             
-        except requests.RequestException as e:
-            logger.error(f"Failed to get access token: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Failed to get access token: %s", e)
             raise RuntimeError(f"Lufthansa API authentication failed: {e}")
     
-    def _make_request(
+    async def _load_shared_token(self, min_ttl: float) -> bool:
+        """Adopt the token published in Redis; True if it is valid for `min_ttl`."""
+        if self._redis is None:
+            return False
+        try:
+            raw = await self._redis.get(self._token_key)
+        except self._redis_errors as e:
+            logger.warning("Could not read shared Lufthansa API token: %s", e)
+            return False
+        if raw:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                data = None
+            if self._is_newer_token(data):
+                self._set_token(data["access_token"], data["expires_at"])
+        return self._token_valid(min_ttl)
+    
+    async def _publish_shared_token(self, expires_in: float) -> None:
+        if self._redis is None:
+            return
+        payload = orjson.dumps({
+            "access_token": self._access_token,
+            "expires_at": self._token_expires_at,
+        })
+        try:
+            await self._redis.set(self._token_key, payload, ex=max(int(expires_in) - 60, 1))
+        except self._redis_errors as e:
+            logger.warning("Could not publish shared Lufthansa API token: %s", e)
+    
+    async def _acquire_refresh_lock(self) -> Optional[str]:
+        """
+        Take the cross-process refresh lock.
+        
+        Returns:
+            str: The lock id on success, None if another process holds the
+                 lock, or _LOCK_UNAVAILABLE if Redis is not configured or
+                 unreachable
+        """
+        if self._redis is None:
+            return _LOCK_UNAVAILABLE
+        lock_id = uuid.uuid4().hex
+        try:
+            if await self._redis.set(self._token_lock_key, lock_id, nx=True, ex=_TOKEN_LOCK_TTL):
+                return lock_id
+        except self._redis_errors as e:
+            logger.warning("Could not take Lufthansa token refresh lock: %s", e)
+            return _LOCK_UNAVAILABLE
+        return None
+    
+    async def _release_refresh_lock(self, lock_id: str) -> None:
+        try:
+            await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, self._token_lock_key, lock_id)
+        except self._redis_errors as e:
+            logger.warning("Could not release Lufthansa token refresh lock: %s", e)
+    
+    async def _wait_for_shared_token(self, min_ttl: float) -> bool:
+        """Poll Redis while another process refreshes; False if it never publishes."""
+        if self._redis is None:
+            return False
+        deadline = time.monotonic() + _SHARED_TOKEN_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_SHARED_TOKEN_POLL)
+            if await self._load_shared_token(min_ttl):
+                return True
+        return False
+    
+    def _is_newer_token(self, data: Any) -> bool:
+        """
+        Check a persisted or shared token record before adopting it.
+        
+        Malformed records (e.g. from an older version or another tool)
+        count as a cache miss rather than raising.
+        """
+        if not isinstance(data, dict):
+            return False
+        token = data.get("access_token")
+        expires_at = data.get("expires_at")
+        return (
+            isinstance(token, str)
+            and bool(token)
+            and token != self._rejected_token
+            and isinstance(expires_at, (int, float))
+            and not isinstance(expires_at, bool)
+            and expires_at > self._token_expires_at
+        )
+    
+    def _load_cached_token(self) -> None:
+        """Adopt the token persisted on disk if it belongs to this client and is newer."""
+        if not self._token_path:
+            return
+        try:
+            with open(self._token_path, "rb") as f:
+                data = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return
+        if self._is_newer_token(data) and data.get("client_id") == self.client_id:
+            self._set_token(data["access_token"], data["expires_at"])
+    
+    def _save_cached_token(self) -> None:
+        """
+        Persist the current token with owner-only permissions.
+        
+        Written to a per-process temp file and moved into place with
+        os.replace, so concurrent readers see the old or the new token,
+        never a partial file.
+        """
+        if not self._token_path:
+            return
+        payload = orjson.dumps({
+            "client_id": self.client_id,
+            "access_token": self._access_token,
+            "expires_at": self._token_expires_at,
+        })
+        tmp_path = f"{self._token_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._token_path), exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._token_path)
+        except OSError as e:
+            logger.warning("Could not persist Lufthansa API token: %s", e)
+    
+    async def _token_refresher_loop(self) -> None:
+        """Keep the token fresh so requests never wait on the OAuth round-trip."""
+        while True:
+            delay = self._token_expires_at - _TOKEN_REFRESH_AHEAD - time.time()
+            await asyncio.sleep(max(delay, _TOKEN_RETRY_DELAY))
+            try:
+                await self._refresh_token(min_ttl=_TOKEN_REFRESH_AHEAD)
+            except RuntimeError:
+                # Already logged; the inline path still refreshes on demand
+                pass
+    
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
@@ -104,37 +521,98 @@ class LufthansaAPIClient:
         Returns:
             dict: JSON response
         """
-        token = self._get_access_token()
+        session = await self._ensure_session()
+        token = await self._get_access_token()
         
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-        }
+        url = self.base_url + endpoint
+        headers = _BASE_HEADERS | {"Authorization": self._auth_header}
         
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                timeout=15,
-            )
-            response.raise_for_status()
-            return response.json()
+        attempt = 0
+        reauthenticated = False
+        while True:
+            status = None
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                ) as response:
+                    status = response.status
+                    if status == 401 and not reauthenticated:
+                        # Handled below, once the response is released
+                        pass
+                    elif status in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                        logger.warning("Lufthansa API returned %s, retrying", status)
+                    else:
+                        if status >= 400:
+                            logger.error("Lufthansa API error: %s - %s", status, await response.text())
+                        response.raise_for_status()
+                        # orjson parses the raw bytes directly, skipping the str decode
+                        return orjson.loads(await response.read())
+                
+            except aiohttp.ClientResponseError:
+                # Already logged above with the response body
+                raise
+            except aiohttp.ClientConnectionError as e:
+                if attempt == _MAX_RETRIES:
+                    logger.error("Lufthansa API request failed: %s", e)
+                    raise
+                logger.warning("Lufthansa API connection error, retrying: %s", e)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error("Lufthansa API request failed: %s", e)
+                raise
             
-        except requests.HTTPError as e:
-            logger.error(f"Lufthansa API error: {e.response.status_code} - {e.response.text}")
-            raise
-        except requests.RequestException as e:
-            logger.error(f"Lufthansa API request failed: {e}")
-            raise
+            if status == 401 and not reauthenticated:
+                # Token revoked early or clock skew: refresh once and
+                # re-issue the same request immediately
+                logger.info("Lufthansa API rejected the access token, refreshing")
+                reauthenticated = True
+                self._reject_token(token)
+                token = await self._get_access_token()
+                headers = _BASE_HEADERS | {"Authorization": self._auth_header}
+                continue
+            
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+    
+    async def _cached_get(
+        self,
+        cache: TTLCache,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        readonly: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        GET `endpoint` through `cache`, coalescing concurrent identical calls.
+        
+        The cached response is shared by every caller, so each gets a deep
+        copy unless `readonly` promises it is only read (e.g. parsed into
+        a new dict). Errors propagate to every waiter and are never cached.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        response = cache.get(key)
+        if response is None:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._make_request("GET", endpoint, params))
+                self._inflight[key] = task
+                task.add_done_callback(functools.partial(self._finish_inflight, key, cache))
+            # Shielded so one cancelled caller doesn't cancel the shared request
+            response = await asyncio.shield(task)
+        return response if readonly else copy.deepcopy(response)
+    
+    def _finish_inflight(self, key: tuple, cache: TTLCache, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            cache.set(key, task.result())
     
     # ========================================
     # Flight Status APIs
     # ========================================
     
-    def get_flight_status(
+    async def get_flight_status(
         self,
         flight_number: str,
         date: str,
@@ -156,23 +634,24 @@ class LufthansaAPIClient:
         API Endpoint:
             GET /operations/flightstatus/{flightNumber}/{date}
         """
-        logger.info(f"Getting flight status: {flight_number} on {date}")
+        logger.info("Getting flight status: %s on %s", flight_number, date)
         
         endpoint = f"/operations/flightstatus/{flight_number}/{date}"
         
         try:
-            response = self._make_request("GET", endpoint)
+            response = await self._cached_get(self._volatile_cache, endpoint, readonly=True)
             return self._parse_flight_status(response)
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
                 return {"error": f"Flight {flight_number} not found for {date}"}
             raise
     
-    def get_flight_status_by_route(
+    async def get_flight_status_by_route(
         self,
         origin: str,
         destination: str,
         date: str,
+        airline_codes: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get status of flights between two airports.
@@ -181,6 +660,10 @@ class LufthansaAPIClient:
             origin: Departure airport IATA code (e.g., "HAM")
             destination: Arrival airport IATA code (e.g., "FRA")
             date: Flight date in YYYY-MM-DD format
+            airline_codes: Only keep flights marketed by these airlines.
+                The endpoint has no carrier parameter, so other carriers
+                are dropped before parsing and the result is marked
+                "filtered".
         
         Returns:
             dict: List of flights on the route with status
@@ -188,19 +671,19 @@ class LufthansaAPIClient:
         API Endpoint:
             GET /operations/flightstatus/route/{origin}/{destination}/{date}
         """
-        logger.info(f"Getting flights: {origin} → {destination} on {date}")
+        logger.info("Getting flights: %s → %s on %s", origin, destination, date)
         
         endpoint = f"/operations/flightstatus/route/{origin}/{destination}/{date}"
         
         try:
-            response = self._make_request("GET", endpoint)
-            return self._parse_route_flights(response)
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
+            response = await self._make_request("GET", endpoint)
+            return self._parse_route_flights(response, airline_codes)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
                 return {"flights": [], "message": f"No flights found {origin}→{destination} on {date}"}
             raise
     
-    def get_arrivals(
+    async def get_arrivals(
         self,
         airport: str,
         from_time: str,
@@ -218,9 +701,9 @@ class LufthansaAPIClient:
             GET /operations/flightstatus/arrivals/{airport}/{fromDateTime}
         """
         endpoint = f"/operations/flightstatus/arrivals/{airport}/{from_time}"
-        return self._make_request("GET", endpoint, {"limit": limit})
+        return await self._make_request("GET", endpoint, {"limit": limit})
     
-    def get_departures(
+    async def get_departures(
         self,
         airport: str,
         from_time: str,
@@ -238,13 +721,13 @@ class LufthansaAPIClient:
             GET /operations/flightstatus/departures/{airport}/{fromDateTime}
         """
         endpoint = f"/operations/flightstatus/departures/{airport}/{from_time}"
-        return self._make_request("GET", endpoint, {"limit": limit})
+        return await self._make_request("GET", endpoint, {"limit": limit})
     
     # ========================================
     # Flight Schedules APIs
     # ========================================
     
-    def get_schedules(
+    async def get_schedules(
         self,
         origin: str,
         destination: str,
@@ -263,15 +746,15 @@ class LufthansaAPIClient:
         API Endpoint:
             GET /operations/schedules/{origin}/{destination}/{fromDateTime}
         """
-        logger.info(f"Getting schedules: {origin} → {destination} on {date}")
+        logger.info("Getting schedules: %s → %s on %s", origin, destination, date)
         
         endpoint = f"/operations/schedules/{origin}/{destination}/{date}"
-        params = {"directFlights": direct_flights}
+        params = {"directFlights": "true" if direct_flights else "false"}
         
         try:
-            return self._make_request("GET", endpoint, params)
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
+            return await self._cached_get(self._volatile_cache, endpoint, params)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
                 return {"schedules": [], "message": "No schedules found"}
             raise
     
@@ -279,20 +762,74 @@ class LufthansaAPIClient:
     # Reference Data APIs
     # ========================================
     
-    def get_airport(self, airport_code: str) -> Dict[str, Any]:
+    async def get_airport(self, airport_code: str) -> Dict[str, Any]:
         """Get airport information by IATA code."""
         endpoint = f"/references/airports/{airport_code}"
-        return self._make_request("GET", endpoint)
+        return await self._cached_get(self._reference_cache, endpoint)
     
-    def get_airline(self, airline_code: str) -> Dict[str, Any]:
+    async def get_airline(self, airline_code: str) -> Dict[str, Any]:
         """Get airline information by IATA code."""
         endpoint = f"/references/airlines/{airline_code}"
-        return self._make_request("GET", endpoint)
+        return await self._cached_get(self._reference_cache, endpoint)
     
-    def get_aircraft(self, aircraft_code: str) -> Dict[str, Any]:
+    async def get_aircraft(self, aircraft_code: str) -> Dict[str, Any]:
         """Get aircraft information by IATA code."""
         endpoint = f"/references/aircraft/{aircraft_code}"
-        return self._make_request("GET", endpoint)
+        return await self._cached_get(self._reference_cache, endpoint)
+    
+    # ========================================
+    # Batch APIs
+    # ========================================
+    # Each item is requested concurrently; one failure doesn't sink the
+    # batch, its exception is returned in place of that item's result.
+    
+    async def get_flight_statuses(
+        self,
+        items: Iterable[Tuple[str, str]],
+    ) -> List[Any]:
+        """Get status for several (flight_number, date) pairs at once."""
+        return await asyncio.gather(
+            *(self.get_flight_status(flight_number, date) for flight_number, date in items),
+            return_exceptions=True,
+        )
+    
+    async def get_arrivals_for_airports(
+        self,
+        airports: Iterable[str],
+        from_time: str,
+        limit: int = 20,
+    ) -> List[Any]:
+        """Get arriving flights for several airports at once."""
+        return await asyncio.gather(
+            *(self.get_arrivals(airport, from_time, limit) for airport in airports),
+            return_exceptions=True,
+        )
+    
+    async def get_departures_for_airports(
+        self,
+        airports: Iterable[str],
+        from_time: str,
+        limit: int = 20,
+    ) -> List[Any]:
+        """Get departing flights for several airports at once."""
+        return await asyncio.gather(
+            *(self.get_departures(airport, from_time, limit) for airport in airports),
+            return_exceptions=True,
+        )
+    
+    async def get_schedules_for_routes(
+        self,
+        routes: Iterable[Tuple[str, str, str]],
+        direct_flights: bool = False,
+    ) -> List[Any]:
+        """Get schedules for several (origin, destination, date) routes at once."""
+        return await asyncio.gather(
+            *(
+                self.get_schedules(origin, destination, date, direct_flights)
+                for origin, destination, date in routes
+            ),
+            return_exceptions=True,
+        )
     
     # ========================================
     # Response Parsers
@@ -300,102 +837,92 @@ class LufthansaAPIClient:
     
     def _parse_flight_status(self, response: Dict) -> Dict[str, Any]:
         """Parse flight status response into clean format."""
-        try:
-            flight_data = response.get("FlightStatusResource", {})
-            flights = flight_data.get("Flights", {}).get("Flight", [])
-            
-            if not flights:
-                return {"error": "No flight data in response"}
-            
-            # Handle single flight vs list
-            flight = flights[0] if isinstance(flights, list) else flights
-            
-            departure = flight.get("Departure", {})
-            arrival = flight.get("Arrival", {})
-            status = flight.get("FlightStatus", {})
-            equipment = flight.get("Equipment", {})
-            
-            return {
-                "flight": flight.get("MarketingCarrier", {}).get("FlightNumber", ""),
-                "airline": flight.get("MarketingCarrier", {}).get("AirlineID", ""),
-                "status": status.get("Code", "unknown"),
-                "status_description": self._get_status_description(status.get("Code", "")),
-                "departure": {
-                    "airport": departure.get("AirportCode", ""),
-                    "terminal": departure.get("Terminal", {}).get("Name", ""),
-                    "gate": departure.get("Terminal", {}).get("Gate", ""),
-                    "scheduled": departure.get("ScheduledTimeLocal", {}).get("DateTime", ""),
-                    "estimated": departure.get("EstimatedTimeLocal", {}).get("DateTime", ""),
-                    "actual": departure.get("ActualTimeLocal", {}).get("DateTime", ""),
-                },
-                "arrival": {
-                    "airport": arrival.get("AirportCode", ""),
-                    "terminal": arrival.get("Terminal", {}).get("Name", ""),
-                    "gate": arrival.get("Terminal", {}).get("Gate", ""),
-                    "scheduled": arrival.get("ScheduledTimeLocal", {}).get("DateTime", ""),
-                    "estimated": arrival.get("EstimatedTimeLocal", {}).get("DateTime", ""),
-                    "actual": arrival.get("ActualTimeLocal", {}).get("DateTime", ""),
-                },
-                "aircraft": {
-                    "code": equipment.get("AircraftCode", ""),
-                    "registration": equipment.get("AircraftRegistration", ""),
-                },
-            }
-            
-        except (KeyError, TypeError) as e:
-            logger.error(f"Error parsing flight status: {e}")
-            return {"error": f"Failed to parse flight status: {e}", "raw": response}
+        flights = _dig(response, _FLIGHTS_PATH, None)
+        
+        if not flights:
+            return {"error": "No flight data in response"}
+        
+        # Handle single flight vs list
+        flight = flights[0] if isinstance(flights, list) else flights
+        
+        # One shape check up front; every field below is read with _dig,
+        # which tolerates missing or null keys
+        if not isinstance(flight, dict):
+            logger.error("Unexpected flight status shape: %s", type(flight).__name__)
+            # response is the shared cached object (readonly=True), so copy it
+            return {"error": "Failed to parse flight status: unexpected response shape", "raw": copy.deepcopy(response)}
+        
+        departure = flight.get("Departure")
+        arrival = flight.get("Arrival")
+        code = _dig(flight, _STATUS_CODE_PATH, None)
+        
+        return {
+            "flight": _dig(flight, _FLIGHT_NUMBER_PATH),
+            "airline": _dig(flight, _AIRLINE_PATH),
+            "status": "unknown" if code is None else code,
+            "status_description": self._get_status_description("" if code is None else code),
+            "departure": {name: _dig(departure, path) for name, path in _ENDPOINT_FIELDS},
+            "arrival": {name: _dig(arrival, path) for name, path in _ENDPOINT_FIELDS},
+            "aircraft": {name: _dig(flight, path) for name, path in _AIRCRAFT_FIELDS},
+        }
     
-    def _parse_route_flights(self, response: Dict) -> Dict[str, Any]:
-        """Parse route flights response."""
-        try:
-            flight_data = response.get("FlightStatusResource", {})
-            flights = flight_data.get("Flights", {}).get("Flight", [])
-            
-            if not isinstance(flights, list):
-                flights = [flights] if flights else []
-            
-            parsed_flights = []
-            for flight in flights:
-                parsed_flights.append(self._parse_single_flight(flight))
-            
-            return {"flights": parsed_flights, "count": len(parsed_flights)}
-            
-        except (KeyError, TypeError) as e:
-            logger.error(f"Error parsing route flights: {e}")
-            return {"flights": [], "error": str(e)}
+    def _parse_route_flights(
+        self,
+        response: Dict,
+        airline_codes: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Parse route flights response, optionally keeping only `airline_codes`."""
+        flights = _dig(response, _FLIGHTS_PATH, None)
+        
+        if not isinstance(flights, list):
+            flights = [flights] if flights else []
+        
+        if not all(isinstance(flight, dict) for flight in flights):
+            logger.error("Unexpected route flights shape")
+            return {"flights": [], "error": "unexpected response shape"}
+        
+        if airline_codes is not None:
+            codes = frozenset(airline_codes)
+            flights = [
+                flight for flight in flights
+                if _dig(flight, _AIRLINE_PATH, None) in codes
+            ]
+        
+        # A list, not a generator: the result is cached by the tools,
+        # iterated more than once, and returned to the model as JSON
+        parse = self._parse_single_flight
+        parsed_flights = [parse(flight) for flight in flights]
+        
+        result = {"flights": parsed_flights, "count": len(parsed_flights)}
+        if airline_codes is not None:
+            result["filtered"] = True
+        return result
     
     def _parse_single_flight(self, flight: Dict) -> Dict[str, Any]:
         """Parse a single flight from the response."""
-        departure = flight.get("Departure", {})
-        arrival = flight.get("Arrival", {})
-        
-        return {
-            "flight": f"{flight.get('MarketingCarrier', {}).get('AirlineID', '')}{flight.get('MarketingCarrier', {}).get('FlightNumber', '')}",
-            "status": flight.get("FlightStatus", {}).get("Code", ""),
-            "departure_time": departure.get("ScheduledTimeLocal", {}).get("DateTime", ""),
-            "arrival_time": arrival.get("ScheduledTimeLocal", {}).get("DateTime", ""),
-            "origin": departure.get("AirportCode", ""),
-            "destination": arrival.get("AirportCode", ""),
-        }
+        parsed = {"flight": f"{_dig(flight, _AIRLINE_PATH)}{_dig(flight, _FLIGHT_NUMBER_PATH)}"}
+        for name, path in _ROUTE_FLIGHT_FIELDS:
+            parsed[name] = _dig(flight, path)
+        return parsed
     
-    def _get_status_description(self, code: str) -> str:
+    @staticmethod
+    def _get_status_description(code: str) -> str:
         """Convert status code to human-readable description."""
-        status_map = {
-            "CD": "Cancelled",
-            "DP": "Departed",
-            "LD": "Landed",
-            "RT": "Rerouted",
-            "DV": "Diverted",
-            "HD": "On Hold",
-            "FE": "Flight Early",
-            "NI": "Next Information",
-            "OT": "On Time",
-            "DL": "Delayed",
-            "NO": "No Status",
-        }
-        return status_map.get(code, f"Unknown ({code})")
+        description = _STATUS_CODES.get(code)
+        if description is None:
+            description = f"Unknown ({code})"
+        return description
 
 
-# Create singleton instance
-lufthansa_client = LufthansaAPIClient()
+@functools.cache
+def get_lufthansa_client() -> LufthansaAPIClient:
+    """
+    Return the shared client, creating it on first use.
+    
+    Deferred so importing the tools doesn't construct the client (and read
+    the persisted token) until a Lufthansa call is actually made. The
+    client is closed at interpreter exit.
+    """
+    client = LufthansaAPIClient()
+    atexit.register(client._close_at_exit)
+    return client